@@ -39,18 +39,19 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting Auto-Code Platform API...")
     db.connect()
 
-    if not db.verify_connectivity():
+    if not await db.verify_connectivity():
         logger.warning("⚠️  Unable to connect to Neo4j")
     else:
         logger.info("✓ Neo4j connected")
-        db.init_constraints()
+        await db.init_constraints()
         logger.info("✓ Database constraints initialized")
+        await db.warm_up()
 
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down...")
-    db.close()
+    await db.close()
     logger.info("✓ Closed")
 
 
@@ -94,7 +95,7 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    neo4j_status = "healthy" if db.verify_connectivity() else "unhealthy"
+    neo4j_status = "healthy" if await db.verify_connectivity() else "unhealthy"
 
     return {
         "status": "healthy" if neo4j_status == "healthy" else "degraded",
@@ -104,5 +105,12 @@ async def health_check():
 
 if __name__ == "__main__":
     uvicorn.run(
-        "main:app", host=config.API_HOST, port=config.API_PORT, reload=True, log_level="info"
+        "main:app",
+        host=config.API_HOST,
+        port=config.API_PORT,
+        reload=True,
+        log_level="info",
+        # Heartbeats WebSocket gérés par le protocole (trames ping/pong RFC 6455)
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
     )
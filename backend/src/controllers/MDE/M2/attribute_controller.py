@@ -16,6 +16,7 @@ from src.repositories.MDE.M2.concept_repository import ConceptRepository
 from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
 from src.services.MDE.M2.attribute_service import AttributeService
 from src.utils.auth import get_current_user
+from src.utils.responses import orjson_response
 
 from ...base_controller import BaseController
 
@@ -154,7 +155,7 @@ async def get_attributes_by_concept(
     controller: AttributeController = Depends(get_controller),
 ):
     """Get all attributes for a specific concept"""
-    return await controller.get_by_concept(concept_id, skip, limit)
+    return orjson_response(await controller.get_by_concept(concept_id, skip, limit))
 
 
 @router.get("/metamodel/{metamodel_id}", response_model=list[Attribute])
@@ -166,7 +167,7 @@ async def get_attributes_by_metamodel(
 ):
     """Get all attributes for a specific metamodel"""
     attributes = await controller.service.attribute_repo.get_by_metamodel(metamodel_id, skip, limit)
-    return attributes
+    return orjson_response(attributes)
 
 
 @router.get("/{attribute_id}", response_model=Attribute)
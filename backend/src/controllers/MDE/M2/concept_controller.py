@@ -15,6 +15,7 @@ from src.repositories.MDE.M2.concept_repository import ConceptRepository
 from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
 from src.services.MDE.M2.concept_service import ConceptService
 from src.utils.auth import get_current_user
+from src.utils.responses import orjson_response
 
 logger = logging.getLogger(__name__)
 
@@ -121,9 +122,10 @@ async def list_concepts(
     - **limit**: Maximum number of records to return
     """
     if metamodel_id:
-        return await controller.get_by_metamodel(metamodel_id, skip, limit)
+        concepts = await controller.get_by_metamodel(metamodel_id, skip, limit)
     else:
-        return await controller.get_all(current_user, db, skip, limit)
+        concepts = await controller.get_all(current_user, db, skip, limit)
+    return orjson_response(concepts)
 
 
 @router.get("/{concept_id}", response_model=Concept)
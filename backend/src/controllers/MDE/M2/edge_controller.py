@@ -3,15 +3,15 @@ Edge Controller - API endpoints for metamodel edges
 """
 
 import logging
-from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from src.database import get_db
 from src.models.MDE.M2 import MetamodelEdgeCreate, MetamodelEdgeType, MetamodelEdgeUpdate
 from src.models.oauth.user import User
 from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
 from src.utils.auth import get_current_user
+from src.utils.responses import serialize_graph_dict
 
 logger = logging.getLogger(__name__)
 
@@ -19,18 +19,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/edges", tags=["edges"])
 
 
+# Valeurs acceptées, pour les messages d'erreur
+_EDGE_TYPE_VALUES = [e.value for e in MetamodelEdgeType]
+
+
+def _parse_edge_type(value: str) -> MetamodelEdgeType:
+    """Convertir le string en enum (majuscules et minuscules acceptées) ou lever une 400"""
+    edge_type = MetamodelEdgeType.from_value(value)
+    if edge_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid edge type: {value}. Must be one of: {_EDGE_TYPE_VALUES}",
+        )
+    return edge_type
+
+
 def get_edge_repository(db=Depends(get_db)):
     """Dependency to get edge repository"""
     return MetamodelEdgeRepository(db)
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+# Réponse construite directement (orjson) : le code 201 est porté par la Response
+@router.post(
+    "/",
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"description": "Created edge"}},
+)
 async def create_edge(
     edge_data: MetamodelEdgeCreate,
     current_user: User = Depends(get_current_user),
     db=Depends(get_db),
     edge_repo: MetamodelEdgeRepository = Depends(get_edge_repository),
-) -> dict[str, Any]:
+) -> Response:
     """
     Create a new edge between two nodes
 
@@ -40,17 +60,11 @@ async def create_edge(
     Returns:
         Created edge
     """
-    try:
-        # Convertir le string en enum si nécessaire (accepter majuscules et minuscules)
-        if isinstance(edge_data.edge_type, str):
-            edge_type_enum = MetamodelEdgeType(edge_data.edge_type.lower())
-        else:
-            edge_type_enum = edge_data.edge_type
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid edge type: {edge_data.edge_type}. Must be one of: {[e.value for e in MetamodelEdgeType]}",
-        )
+    # Convertir le string en enum si nécessaire (accepter majuscules et minuscules)
+    if isinstance(edge_data.edge_type, MetamodelEdgeType):
+        edge_type_enum = edge_data.edge_type
+    else:
+        edge_type_enum = _parse_edge_type(edge_data.edge_type)
 
     logger.info(
         f"Creating edge: {edge_type_enum.value} from {edge_data.source_id} to {edge_data.target_id} "
@@ -64,7 +78,11 @@ async def create_edge(
 
         logger.info(f"✅ Edge created successfully: {edge.id}")
         # Retourner le dictionnaire formaté pour le frontend avec le champ 'label'
-        return edge.to_graph_dict()
+        return Response(
+            serialize_graph_dict(edge.to_graph_dict()),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
+        )
 
     except ValueError as e:
         logger.error(f"❌ Error creating edge: {e}")
@@ -77,14 +95,14 @@ async def create_edge(
         )
 
 
-@router.patch("/{edge_id}")
+@router.patch("/{edge_id}", response_model=None)
 async def update_edge(
     edge_id: str,
     updates: MetamodelEdgeUpdate,
     current_user: User = Depends(get_current_user),
     db=Depends(get_db),
     edge_repo: MetamodelEdgeRepository = Depends(get_edge_repository),
-):
+) -> Response:
     """
     Update an edge's metadata (e.g. description)
 
@@ -107,13 +125,7 @@ async def update_edge(
 
     edge_type_str, source_id, target_id = parts
 
-    try:
-        edge_type_enum = MetamodelEdgeType(edge_type_str.lower())
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid edge type: {edge_type_str}. Must be one of: {[e.value for e in MetamodelEdgeType]}",
-        )
+    edge_type_enum = _parse_edge_type(edge_type_str)
 
     update_dict = updates.model_dump(exclude_unset=True)
     if not update_dict:
@@ -132,7 +144,7 @@ async def update_edge(
             detail=f"Edge not found: {edge_id}",
         )
 
-    return edge.to_graph_dict()
+    return Response(serialize_graph_dict(edge.to_graph_dict()), media_type="application/json")
 
 
 @router.delete("/{edge_id}")
@@ -163,13 +175,7 @@ async def delete_edge_by_id(
 
     edge_type_str, source_id, target_id = parts
 
-    try:
-        edge_type_enum = MetamodelEdgeType(edge_type_str.lower())
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid edge type: {edge_type_str}. Must be one of: {[e.value for e in MetamodelEdgeType]}",
-        )
+    edge_type_enum = _parse_edge_type(edge_type_str)
 
     deleted = await edge_repo.delete_edge(source_id, target_id, edge_type_enum)
 
@@ -205,14 +211,8 @@ async def delete_edge(
     Returns:
         Success message
     """
-    try:
-        # Convertir le string en enum (accepter majuscules et minuscules)
-        edge_type_enum = MetamodelEdgeType(edge_type.lower())
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid edge type: {edge_type}. Must be one of: {[e.value for e in MetamodelEdgeType]}",
-        )
+    # Convertir le string en enum (accepter majuscules et minuscules)
+    edge_type_enum = _parse_edge_type(edge_type)
 
     logger.info(f"Deleting edge: {edge_type} from {source_id} to {target_id}")
 
@@ -6,7 +6,7 @@ import logging
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from ....database import get_db
 from ....models import Metamodel, MetamodelCreate, MetamodelGraphResponse, MetamodelUpdate
@@ -14,12 +14,30 @@ from ....models.oauth.user import User
 from ....repositories.MDE.M2.metamodel_repository import MetamodelRepository
 from ....services.MDE.M2.metamodel_service import MetamodelService
 from ....utils.auth import get_current_user
+from ....utils.responses import orjson_response
 from ...base_controller import BaseController
 
 router = APIRouter(prefix="/api/metamodels", tags=["metamodels"])
 logger = logging.getLogger(__name__)
 
 
+def _graph_response(graph_data: dict[str, Any]) -> Response:
+    """
+    Serialize the graph payload with orjson
+
+    nodes/edges are already plain dicts (to_graph_dict): they are dumped as is
+    instead of being re-validated and copied through MetamodelGraphResponse.
+    """
+    return orjson_response(
+        {
+            "metamodel": graph_data["metamodel"],
+            "nodes": graph_data["nodes"],
+            "edges": graph_data["edges"],
+            "edgeConstraints": graph_data["edgeConstraints"],
+        }
+    )
+
+
 class MetamodelController(BaseController[Metamodel, MetamodelCreate, MetamodelUpdate]):
     """Metamodel Controller with CRUD operations"""
 
@@ -202,11 +220,12 @@ async def list_metamodels(
     - **limit**: Maximum number of records to return
     """
     if status:
-        return await controller.get_by_status(status)
+        metamodels = await controller.get_by_status(status)
     elif author:
-        return await controller.get_by_author(author)
+        metamodels = await controller.get_by_author(author)
     else:
-        return await controller.get_all(current_user, db, skip, limit)
+        metamodels = await controller.get_all(current_user, db, skip, limit)
+    return orjson_response(metamodels)
 
 
 @router.get("/{metamodel_id}", response_model=Metamodel)
@@ -318,7 +337,7 @@ async def get_metamodel_graph(
         logger.info(
             f"✅ Graph retrieved: {len(graph_data['nodes'])} nodes, {len(graph_data['edges'])} edges"
         )
-        return graph_data
+        return _graph_response(graph_data)
     except ValueError as e:
         logger.error(f"❌ Error getting graph: {e}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -18,6 +18,7 @@ from src.models.MDE.M2.relationship import (
 from src.models.oauth.user import User
 from src.services.MDE.M2.relationship_service import RelationshipService
 from src.utils.auth import get_current_user
+from src.utils.responses import orjson_response
 
 from ...base_controller import BaseController
 
@@ -200,7 +201,9 @@ async def get_relationships_by_metamodel(
     controller: RelationshipController = Depends(get_controller),
 ):
     """Get all relationships for a specific metamodel"""
-    return await controller.get_by_metamodel(metamodel_id, skip, limit, include_inverse)
+    return orjson_response(
+        await controller.get_by_metamodel(metamodel_id, skip, limit, include_inverse)
+    )
 
 
 @router.get("/concept/{concept_id}")
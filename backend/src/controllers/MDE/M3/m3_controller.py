@@ -6,7 +6,8 @@ This exposes the M3 type system (NodeType, EdgeType) to the frontend.
 
 from typing import Any
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from src.models.graph.edge_type import EdgeType
 from src.models.graph.node_type import NodeType
@@ -14,6 +15,9 @@ from src.models.MDE.M3.m3_config import M3Config
 
 router = APIRouter(prefix="/api/m3", tags=["M3"])
 
+# Les contraintes sont immuables : sérialisées une seule fois
+_EDGE_CONSTRAINTS_JSON = orjson.dumps(M3Config.get_edge_constraints())
+
 
 @router.get("/node-types", response_model=list[NodeType])
 async def get_node_types() -> list[NodeType]:
@@ -75,8 +79,8 @@ async def get_edge_type(type_id: str) -> EdgeType:
     return edge_type
 
 
-@router.get("/edge-constraints")
-async def get_edge_constraints() -> list[dict[str, Any]]:
+@router.get("/edge-constraints", response_model=list[dict[str, Any]])
+async def get_edge_constraints() -> Response:
     """
     Get edge constraints for the graph editor
 
@@ -93,7 +97,7 @@ async def get_edge_constraints() -> list[dict[str, Any]]:
             "directed": true
         }
     """
-    return M3Config.get_edge_constraints()
+    return Response(content=_EDGE_CONSTRAINTS_JSON, media_type="application/json")
 
 
 @router.get("/config")
@@ -5,6 +5,7 @@ import logging
 import os
 from pathlib import Path
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.controllers.MDE.M2.metamodel_controller import get_metamodel_controller
@@ -12,6 +13,7 @@ from src.database import get_db
 from src.models.MDE.M2.metamodel_edge import MetamodelEdgeType
 from src.models.oauth.user import User
 from src.utils.auth import get_current_user
+from src.utils.responses import serialize_graph_dict
 
 logger = logging.getLogger(__name__)
 
@@ -39,14 +41,13 @@ async def get_ir_graph(
     Returns the graph in the standard IR JSON format
     with metadata, nodes, edges, and edgeConstraints.
     """
+    from src.repositories.MDE.M2.attribute_repository import AttributeRepository
+    from src.repositories.MDE.M2.concept_repository import ConceptRepository
+    from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
+    from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
+    from src.repositories.MDE.M2.relationship_repository import RelationshipRepository
     from src.services.MDE.M2.metamodel_service import MetamodelService
 
-    from ....repositories.MDE.M2.attribute_repository import AttributeRepository
-    from ....repositories.MDE.M2.concept_repository import ConceptRepository
-    from ....repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
-    from ....repositories.MDE.M2.metamodel_repository import MetamodelRepository
-    from ....repositories.MDE.M2.relationship_repository import RelationshipRepository
-
     metamodel_repo = MetamodelRepository(db)
     concept_repo = ConceptRepository(db)
     attribute_repo = AttributeRepository(db)
@@ -89,14 +90,13 @@ async def save_ir_graph(
     """
     _ensure_storage_dir()
 
+    from src.repositories.MDE.M2.attribute_repository import AttributeRepository
+    from src.repositories.MDE.M2.concept_repository import ConceptRepository
+    from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
+    from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
+    from src.repositories.MDE.M2.relationship_repository import RelationshipRepository
     from src.services.MDE.M2.metamodel_service import MetamodelService
 
-    from ....repositories.MDE.M2.attribute_repository import AttributeRepository
-    from ....repositories.MDE.M2.concept_repository import ConceptRepository
-    from ....repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
-    from ....repositories.MDE.M2.metamodel_repository import MetamodelRepository
-    from ....repositories.MDE.M2.relationship_repository import RelationshipRepository
-
     metamodel_repo = MetamodelRepository(db)
     concept_repo = ConceptRepository(db)
     attribute_repo = AttributeRepository(db)
@@ -145,7 +145,8 @@ async def save_ir_graph(
     }
 
     file_path = IR_STORAGE_DIR / f"{metamodel_id}.json"
-    file_path.write_text(json.dumps(ir_document, indent=2, default=str), encoding="utf-8")
+    # orjson : datetimes des nodes/edges en ISO 8601, comme les métadonnées
+    file_path.write_bytes(serialize_graph_dict(ir_document, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Saved IR graph for {metamodel_id} to {file_path}")
     return {
@@ -156,6 +157,57 @@ async def save_ir_graph(
     }
 
 
+async def _create_concepts(concept_repo, concepts: list[dict]) -> int:
+    """
+    Create concepts in one batch; if the batch fails, create them one by one
+
+    A single invalid concept makes the whole UNWIND fail: falling back per item
+    only skips that concept, as the other nodes are.
+    """
+    try:
+        return len(await concept_repo.bulk_create(concepts))
+    except Exception as e:
+        logger.warning(f"Bulk concept creation failed, retrying one by one: {e}")
+
+    created = 0
+    for concept in concepts:
+        try:
+            await concept_repo.create(concept)
+            created += 1
+        except Exception as e:
+            logger.warning(f"Skipping node {concept['id']}: {e}")
+    return created
+
+
+async def _create_edges(edge_repo, metamodel_id: str, edges: list[dict]) -> int:
+    """
+    Create edges in one batch per type; if the batch fails, create them one by one
+
+    Edges whose source or target does not exist are skipped (and logged) either way.
+    """
+    try:
+        created = await edge_repo.create_edges_bulk(metamodel_id, edges)
+    except Exception as e:
+        logger.warning(f"Bulk edge creation failed, retrying one by one: {e}")
+    else:
+        created_keys = {(e.edge_type, e.source_id, e.target_id) for e in created}
+        for edge in edges:
+            if (edge["edge_type"], edge["source_id"], edge["target_id"]) not in created_keys:
+                logger.warning(f"Skipping edge {edge['id']}: source or target not found")
+        return len(created)
+
+    count = 0
+    for edge in edges:
+        try:
+            await edge_repo.create_edge(
+                metamodel_id, edge["source_id"], edge["target_id"], edge["edge_type"]
+            )
+            count += 1
+        except Exception as e:
+            logger.warning(f"Skipping edge {edge['id']}: {e}")
+    return count
+
+
 @router.post("/load/{metamodel_id}")
 async def load_ir_graph(
     metamodel_id: str,
@@ -196,11 +248,11 @@ async def load_ir_graph(
             detail=f"Invalid IR graph format: {'; '.join(errors[:5])}",
         )
 
-    from ....repositories.MDE.M2.attribute_repository import AttributeRepository
-    from ....repositories.MDE.M2.concept_repository import ConceptRepository
-    from ....repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
-    from ....repositories.MDE.M2.metamodel_repository import MetamodelRepository
-    from ....repositories.MDE.M2.relationship_repository import RelationshipRepository
+    from src.repositories.MDE.M2.attribute_repository import AttributeRepository
+    from src.repositories.MDE.M2.concept_repository import ConceptRepository
+    from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
+    from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
+    from src.repositories.MDE.M2.relationship_repository import RelationshipRepository
 
     metamodel_repo = MetamodelRepository(db)
     concept_repo = ConceptRepository(db)
@@ -225,8 +277,26 @@ async def load_ir_graph(
     # Recreate nodes and edges from the IR document
     results = {"concepts": 0, "attributes": 0, "relations": 0, "edges": 0}
 
+    # Concepts first, in a single query: attributes and edges reference them
+    concepts = [
+        {
+            "id": node_data["id"],
+            "name": node_data["name"],
+            "description": node_data.get("description", ""),
+            "graph_id": metamodel_id,
+            "x_position": node_data.get("x"),
+            "y_position": node_data.get("y"),
+            "node_type": "concept",
+        }
+        for node_data in ir_document["nodes"]
+        if node_data.get("type", "") == "concept"
+    ]
+    results["concepts"] = await _create_concepts(concept_repo, concepts)
+
     for node_data in ir_document["nodes"]:
         node_type = node_data.get("type", "")
+        if node_type == "concept":
+            continue  # already created in the batch above
         graph_data = {
             "id": node_data["id"],
             "name": node_data["name"],
@@ -237,11 +307,7 @@ async def load_ir_graph(
         }
 
         try:
-            if node_type == "concept":
-                graph_data["node_type"] = "concept"
-                await concept_repo.create(graph_data)
-                results["concepts"] += 1
-            elif node_type == "attribute":
+            if node_type == "attribute":
                 graph_data["type"] = node_data.get("dataType", "string")
                 graph_data["is_required"] = node_data.get("isRequired", False)
                 graph_data["is_unique"] = node_data.get("isUnique", False)
@@ -255,25 +321,20 @@ async def load_ir_graph(
         except Exception as e:
             logger.warning(f"Skipping node {node_data.get('id')}: {e}")
 
-    # Recreate edges
+    # Recreate edges, one UNWIND query per edge type
+    edges = []
     for edge_data in ir_document["edges"]:
-        try:
-            edge_type_str = edge_data.get("type", "").lower()
-            edge_type_enum = None
-            for et in MetamodelEdgeType.__members__.values():
-                if et.value == edge_type_str:
-                    edge_type_enum = et
-                    break
-            if edge_type_enum:
-                await edge_repo.create_edge(
-                    metamodel_id,
-                    edge_data["source"],
-                    edge_data["target"],
-                    edge_type_enum,
-                )
-                results["edges"] += 1
-        except Exception as e:
-            logger.warning(f"Skipping edge {edge_data.get('id')}: {e}")
+        edge_type_enum = MetamodelEdgeType.from_value(edge_data.get("type", ""))
+        if edge_type_enum:
+            edges.append(
+                {
+                    "id": edge_data.get("id"),
+                    "source_id": edge_data["source"],
+                    "target_id": edge_data["target"],
+                    "edge_type": edge_type_enum,
+                }
+            )
+    results["edges"] = await _create_edges(edge_repo, metamodel_id, edges)
 
     logger.info(f"Loaded IR graph for {metamodel_id}: {results}")
     return {
@@ -4,6 +4,7 @@ from typing import Any
 
 from fastapi import HTTPException, status
 
+from ...models.base import batch_timestamp
 from ...models.oauth.user import User
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,8 @@ class GitHubSyncMixin(ABC):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="GitHub account not connected.",
             )
-        resources = await self.sync_from_github(github_token, current_user, db, **kwargs)
+        # Toutes les entités du lot partagent le même created_at
+        with batch_timestamp():
+            resources = await self.sync_from_github(github_token, current_user, db, **kwargs)
         logger.info("Synced %d resources for user %s", len(resources), current_user.username)
         return {"count": len(resources), "resources": resources}
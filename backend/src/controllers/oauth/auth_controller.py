@@ -8,13 +8,13 @@ import secrets
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
 from neo4j import AsyncDriver
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ...database import get_db
 from ...models.oauth.user import User, UserPublic
 from ...repositories.oauth.user_repository import UserRepository
 from ...services import GitHubOAuthService, UserService
-from ...utils.auth import create_access_token, get_current_user
+from ...utils.auth import create_user_token, get_current_user
 from ...utils.config import config
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
@@ -24,6 +24,8 @@ logger = logging.getLogger(__name__)
 class UserUpdate(BaseModel):
     """User update model"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     github_token: str | None = None
 
 
@@ -84,16 +86,16 @@ async def github_callback(
 
         # Step 2: Get or create user from GitHub data
         user = await user_service.get_or_create_from_github(github_access_token)
-        logger.info(f"User authenticated: {user.username}")
+        logger.info("User authenticated: %s", user.username)
 
         # Step 3: Create JWT token for our application
-        jwt_token = create_access_token(data={"sub": user.username, "user_id": user.id})
+        jwt_token = create_user_token(user)
 
         # Redirect to frontend with token as query parameter
         return RedirectResponse(url=f"{config.FRONTEND_URL}/login?token={jwt_token}")
 
     except Exception as e:
-        logger.error(f"OAuth callback error: {str(e)}")
+        logger.error("OAuth callback error: %s", e)
         # Redirect to frontend with error
         return RedirectResponse(url=f"{config.FRONTEND_URL}/login?error={str(e)}")
 
@@ -142,7 +144,7 @@ async def update_current_user(
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    logger.info(f"User {current_user.username} updated their profile")
+    logger.info("User %s updated their profile", current_user.username)
     return UserPublic.from_user(updated_user)
 
 
@@ -154,5 +156,5 @@ async def logout(current_user: User = Depends(get_current_user)):
     Returns:
         Success message
     """
-    logger.info(f"User {current_user.username} logged out")
+    logger.info("User %s logged out", current_user.username)
     return {"message": "Successfully logged out"}
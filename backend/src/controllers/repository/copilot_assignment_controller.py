@@ -7,7 +7,7 @@ Combined controller and routes in single file
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.database import get_db
 from src.models.oauth.user import User
@@ -28,6 +28,8 @@ router = APIRouter(prefix="/api/copilot", tags=["Copilot Assignment"])
 class AssignToCopilotRequest(BaseModel):
     """Request model for assigning issue to Copilot"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     base_branch: str | None = Field(
         None, description="Base branch for the PR (defaults to repository default branch)"
     )
@@ -37,6 +39,8 @@ class AssignToCopilotRequest(BaseModel):
 class AssignToCopilotResponse(BaseModel):
     """Response model for Copilot assignment"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     success: bool
     message: str
     issue_id: str
@@ -47,6 +51,8 @@ class AssignToCopilotResponse(BaseModel):
 class CopilotAvailabilityResponse(BaseModel):
     """Response model for Copilot availability check"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     available: bool
     message: str
     bot_id: str | None = None
@@ -87,13 +93,14 @@ class CopilotAssignmentController:
             CopilotAvailabilityResponse with availability status
         """
         try:
+            # Fail fast: pas de token, pas besoin d'interroger Neo4j
+            token = await self._get_user_token(user)
+
             # Get repository
             repository = await self.repository_repo.get_by_id(repository_id)
             if not repository:
                 raise HTTPException(status_code=404, detail="Repository not found")
 
-            # Get user token and create service instance
-            token = await self._get_user_token(user)
             copilot_service = GitHubCopilotAgentService(token)
 
             # Parse owner/repo from full_name
@@ -120,7 +127,7 @@ class CopilotAssignmentController:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error checking Copilot availability: {e}")
+            logger.error("Error checking Copilot availability: %s", e)
             raise HTTPException(
                 status_code=500, detail=f"Error checking Copilot availability: {str(e)}"
             )
@@ -141,6 +148,9 @@ class CopilotAssignmentController:
             AssignToCopilotResponse with assignment result
         """
         try:
+            # Fail fast: pas de token, pas besoin d'interroger Neo4j
+            token = await self._get_user_token(user)
+
             # Get issue
             issue = await self.issue_repo.get_by_id(issue_id)
             if not issue:
@@ -151,8 +161,7 @@ class CopilotAssignmentController:
             if not repository:
                 raise HTTPException(status_code=404, detail="Repository not found")
 
-            # Get user token and create service instances
-            token = await self._get_user_token(user)
+            # Create service instances
             copilot_service = GitHubCopilotAgentService(token)
             initializer_service = RepositoryInitializerService(token)
 
@@ -163,7 +172,7 @@ class CopilotAssignmentController:
             owner, repo = parts
 
             # 🎯 VÉRIFICATION: Repository initialisé (a des commits)
-            logger.info(f"🔍 Checking if repository {owner}/{repo} is initialized...")
+            logger.info("🔍 Checking if repository %s/%s is initialized...", owner, repo)
             ready_result = await initializer_service.ensure_repository_ready(
                 owner=owner,
                 repo=repo,
@@ -228,7 +237,7 @@ class CopilotAssignmentController:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error assigning issue to Copilot: {e}")
+            logger.error("Error assigning issue to Copilot: %s", e)
             raise HTTPException(
                 status_code=500, detail=f"Error assigning issue to Copilot: {str(e)}"
             )
@@ -245,6 +254,9 @@ class CopilotAssignmentController:
             AssignToCopilotResponse with unassignment result
         """
         try:
+            # Fail fast: pas de token, pas besoin d'interroger Neo4j
+            token = await self._get_user_token(user)
+
             # Get issue
             issue = await self.issue_repo.get_by_id(issue_id)
             if not issue:
@@ -255,8 +267,7 @@ class CopilotAssignmentController:
             if not repository:
                 raise HTTPException(status_code=404, detail="Repository not found")
 
-            # Get user token and create service instance
-            token = await self._get_user_token(user)
+            # Create service instance
             copilot_service = GitHubCopilotAgentService(token)
 
             # Parse owner/repo
@@ -291,7 +302,7 @@ class CopilotAssignmentController:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error unassigning issue from Copilot: {e}")
+            logger.error("Error unassigning issue from Copilot: %s", e)
             raise HTTPException(
                 status_code=500, detail=f"Error unassigning issue from Copilot: {str(e)}"
             )
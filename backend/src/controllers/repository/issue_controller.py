@@ -17,6 +17,7 @@ from ...repositories.repository.repository_repository import RepositoryRepositor
 from ...services.repository.copilot_agent_service import GitHubCopilotAgentService
 from ...services.repository.issue_service import IssueService
 from ...utils.auth import get_current_user
+from ...utils.responses import orjson_response
 from ..base_controller import BaseController
 from ..mixins.github_sync import GitHubSyncMixin
 
@@ -262,9 +263,10 @@ async def list_issues(
 ):
     """List all issues with optional filters"""
     if repository_id:
-        return await controller.get_by_repository(repository_id, status)
+        issues = await controller.get_by_repository(repository_id, status)
     else:
-        return await controller.get_all(current_user, db, skip, limit)
+        issues = await controller.get_all(current_user, db, skip, limit)
+    return orjson_response(issues)
 
 
 @router.get("/{issue_id}", response_model=Issue)
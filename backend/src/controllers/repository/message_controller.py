@@ -4,6 +4,7 @@ Message Controller - Manage PR comments and conversations
 
 import logging
 import uuid
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -17,6 +18,7 @@ from ...repositories.repository.message_repository import MessageRepository
 from ...repositories.repository.repository_repository import RepositoryRepository
 from ...services.repository.message_service import MessageService
 from ...utils.auth import get_current_user
+from ...utils.responses import orjson_response
 from ..base_controller import BaseController
 from ..mixins.github_sync import GitHubSyncMixin
 
@@ -201,9 +203,9 @@ class MessageController(GitHubSyncMixin, BaseController[Message, MessageCreate,
         return await self.service.get_all({"issue_id": issue_id})
 
 
-# Dependency to get controller instance
-def get_message_controller(db=Depends(get_db)) -> MessageController:
-    """FastAPI dependency to get MessageController instance"""
+@lru_cache(maxsize=8)
+def _build_message_controller(db) -> MessageController:
+    """Construit le controller (sans état) une seule fois par connexion"""
     message_repository = MessageRepository(db)
     issue_repository = IssueRepository(db)
     repository_repository = RepositoryRepository(db)
@@ -211,6 +213,12 @@ def get_message_controller(db=Depends(get_db)) -> MessageController:
     return MessageController(message_service, issue_repository, repository_repository)
 
 
+# Dependency to get controller instance
+def get_message_controller(db=Depends(get_db)) -> MessageController:
+    """FastAPI dependency to get MessageController instance"""
+    return _build_message_controller(db)
+
+
 # Route handlers
 
 
@@ -232,7 +240,7 @@ async def list_messages_by_issue(
     controller: MessageController = Depends(get_message_controller),
 ):
     """List all messages for an issue"""
-    return await controller.get_by_issue(issue_id)
+    return orjson_response(await controller.get_by_issue(issue_id))
 
 
 @router.get("/{message_id}", response_model=Message)
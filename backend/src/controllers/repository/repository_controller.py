@@ -16,6 +16,7 @@ from ...repositories.repository.repository_repository import RepositoryRepositor
 from ...services.repository.issue_service import IssueService
 from ...services.repository.repository_service import RepositoryService
 from ...utils.auth import get_current_user
+from ...utils.responses import orjson_response
 from ..base_controller import BaseController
 from ..mixins.github_sync import GitHubSyncMixin
 
@@ -239,7 +240,7 @@ def get_repository_controller(db=Depends(get_db)) -> RepositoryController:
 # Route handlers
 
 
-@router.post("/", response_model=Repository)
+@router.post("/", response_model=Repository, response_model_exclude_none=True)
 async def create_repository(
     repo_data: RepositoryCreate,
     current_user: User = Depends(get_current_user),
@@ -260,7 +261,7 @@ async def sync_repositories(
     return await controller.sync_from_github(current_user.github_token, current_user, db)
 
 
-@router.get("/", response_model=list[Repository])
+@router.get("/", response_model=list[Repository], response_model_exclude_none=True)
 async def list_repositories(
     skip: int = 0,
     limit: int = 100,
@@ -268,10 +269,12 @@ async def list_repositories(
     controller: RepositoryController = Depends(get_repository_controller),
 ):
     """List all repositories for current user"""
-    return await controller.get_by_owner(current_user.username, skip, limit)
+    return orjson_response(
+        await controller.get_by_owner(current_user.username, skip, limit), exclude_none=True
+    )
 
 
-@router.get("/{repository_id}", response_model=Repository)
+@router.get("/{repository_id}", response_model=Repository, response_model_exclude_none=True)
 async def get_repository(
     repository_id: str,
     current_user: User = Depends(get_current_user),
@@ -290,7 +293,7 @@ async def get_repository(
     return repository
 
 
-@router.patch("/{repository_id}", response_model=Repository)
+@router.patch("/{repository_id}", response_model=Repository, response_model_exclude_none=True)
 async def update_repository(
     repository_id: str,
     updates: RepositoryUpdate,
@@ -2,104 +2,254 @@
 Gestion de la connexion à Neo4j
 """
 
+import asyncio
+import hashlib
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 from dotenv import load_dotenv
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, RoutingControl
 
 load_dotenv()
 
+# Contraintes d'unicité créées au démarrage
+CONSTRAINTS = (
+    "CREATE CONSTRAINT user_username_unique IF NOT EXISTS "
+    "FOR (u:User) REQUIRE u.username IS UNIQUE",
+    "CREATE CONSTRAINT user_id_unique IF NOT EXISTS FOR (u:User) REQUIRE u.id IS UNIQUE",
+    "CREATE CONSTRAINT repository_id_unique IF NOT EXISTS "
+    "FOR (r:Repository) REQUIRE r.id IS UNIQUE",
+    "CREATE CONSTRAINT issue_id_unique IF NOT EXISTS FOR (i:Issue) REQUIRE i.id IS UNIQUE",
+)
+
+# Index des recherches MDE : seek indexé au lieu d'un scan de label + filtre
+INDEXES = (
+    "CREATE INDEX metamodel_id IF NOT EXISTS FOR (m:Metamodel) ON (m.id)",
+    "CREATE INDEX concept_id IF NOT EXISTS FOR (c:Concept) ON (c.id)",
+    "CREATE INDEX concept_graph_id IF NOT EXISTS FOR (c:Concept) ON (c.graph_id)",
+    "CREATE INDEX concept_graph_name IF NOT EXISTS FOR (c:Concept) ON (c.graph_id, c.name)",
+)
+
+
+class QueryCache:
+    """Cache LRU à durée de vie limitée pour les résultats de lecture"""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Incrémenté à chaque invalidation : une lecture commencée avant une écriture
+        # ne remet pas son résultat (périmé) dans le cache
+        self.generation = 0
+
+    @staticmethod
+    def make_key(query: str, parameters: dict | None) -> bytes:
+        """Clé stable pour (requête, paramètres)"""
+        raw = query + repr(sorted((parameters or {}).items()))
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, key: bytes, query: str, value: Any, generation: int | None = None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, query, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pattern: str | None = None):
+        """Vide le cache, ou seulement les requêtes contenant ``pattern``"""
+        with self._lock:
+            self.generation += 1
+            if pattern is None:
+                self._entries.clear()
+                return
+            for key in [k for k, entry in self._entries.items() if pattern in entry[1]]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class Neo4jConnection:
     """Classe singleton pour gérer la connexion Neo4j"""
 
     _instance: Optional["Neo4jConnection"] = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
+        with self._lock:
+            if not self._initialized:
+                self._setup()
 
+    def _setup(self):
+        """Lit la configuration (appelé une seule fois, sous verrou)"""
         self.uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "password")
+        self.database = os.getenv("NEO4J_DATABASE", "neo4j")
+        # Paramètres du pool de connexions
+        self.pool_size = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+        self.acquisition_timeout = float(os.getenv("NEO4J_ACQ_TIMEOUT", "60"))
+        self.max_connection_lifetime = float(os.getenv("NEO4J_MAX_CONN_LIFETIME", "3600"))
+        self.connection_timeout = float(os.getenv("NEO4J_CONN_TIMEOUT", "15"))
+        self.warmup_connections = int(os.getenv("NEO4J_WARMUP_CONNECTIONS", "10"))
+        self.cache = QueryCache(
+            maxsize=int(os.getenv("NEO4J_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("NEO4J_CACHE_TTL", "30")),
+        )
+        # Durée (s) pendant laquelle un health check réussi reste valide
+        self.health_ttl = float(os.getenv("NEO4J_HEALTH_TTL", "1"))
+        # Runtime parallèle de Cypher (Neo4j 5.13+ Enterprise) pour les lectures marquées
+        self.parallel_runtime = os.getenv("NEO4J_PARALLEL_RUNTIME", "false").lower() == "true"
+        self._last_ok = 0.0
         self.driver = None
         self._initialized = True
 
     def connect(self):
-        """Établit la connexion à Neo4j"""
+        """Établit la connexion à Neo4j (un seul driver par processus)"""
         if self.driver is None:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-            print(f"✓ Connecté à Neo4j sur {self.uri}")
+            with self._lock:
+                if self.driver is None:
+                    self.driver = AsyncGraphDatabase.driver(
+                        self.uri,
+                        auth=(self.user, self.password),
+                        max_connection_pool_size=self.pool_size,
+                        connection_acquisition_timeout=self.acquisition_timeout,
+                        max_connection_lifetime=self.max_connection_lifetime,
+                        connection_timeout=self.connection_timeout,
+                        keep_alive=True,
+                    )
+                    print(f"✓ Connecté à Neo4j sur {self.uri}")
 
-    def close(self):
+    async def close(self):
         """Ferme la connexion à Neo4j"""
         if self.driver is not None:
-            self.driver.close()
+            await self.driver.close()
             self.driver = None
+            self._last_ok = 0.0
             print("✓ Connexion Neo4j fermée")
 
     def get_session(self):
-        """Retourne une session Neo4j"""
+        """Retourne une session Neo4j asynchrone (à utiliser avec ``async with``)"""
         if self.driver is None:
             self.connect()
-        return self.driver.session()
+        return self.driver.session(database=self.database)
 
-    def verify_connectivity(self):
-        """Vérifie la connectivité avec Neo4j"""
+    async def verify_connectivity(self):
+        """Vérifie la connectivité avec Neo4j (résultat positif mémorisé health_ttl secondes)"""
+        now = time.monotonic()
+        if now - self._last_ok < self.health_ttl:
+            return True
         try:
             self.connect()
-            with self.get_session() as session:
-                result = session.run("RETURN 1 as test")
-                result.single()
+            # Vérification du driver : connexion du pool, sans requête Cypher
+            await self.driver.verify_connectivity()
+            self._last_ok = now
             return True
         except Exception as e:
             print(f"✗ Erreur de connexion à Neo4j : {e}")
             return False
 
-    def init_constraints(self):
-        """Initialise les contraintes Neo4j pour assurer l'unicité"""
+    async def warm_up(self, connections: int | None = None):
+        """Ouvre des connexions du pool au démarrage pour éviter la latence du premier appel"""
+        count = min(connections or self.warmup_connections, self.pool_size)
+        if count <= 0:
+            return
         try:
-            with self.get_session() as session:
-                # Contrainte d'unicité sur User.username
-                session.run(
-                    "CREATE CONSTRAINT user_username_unique IF NOT EXISTS "
-                    "FOR (u:User) REQUIRE u.username IS UNIQUE"
-                )
-
-                # Contrainte d'unicité sur User.id
-                session.run(
-                    "CREATE CONSTRAINT user_id_unique IF NOT EXISTS "
-                    "FOR (u:User) REQUIRE u.id IS UNIQUE"
-                )
-
-                # Contrainte d'unicité sur Repository.id
-                session.run(
-                    "CREATE CONSTRAINT repository_id_unique IF NOT EXISTS "
-                    "FOR (r:Repository) REQUIRE r.id IS UNIQUE"
-                )
-
-                # Contrainte d'unicité sur Issue.id
-                session.run(
-                    "CREATE CONSTRAINT issue_id_unique IF NOT EXISTS "
-                    "FOR (i:Issue) REQUIRE i.id IS UNIQUE"
-                )
-
-                print("✓ Contraintes Neo4j initialisées")
+            # Requêtes concurrentes : chacune emprunte (et garde ouverte) sa propre connexion
+            await asyncio.gather(*(self.execute_read("RETURN 1") for _ in range(count)))
+            print(f"✓ Pool Neo4j préchauffé ({count} connexions)")
+        except Exception as e:
+            print(f"⚠️  Erreur lors du préchauffage du pool : {e}")
+
+    async def init_constraints(self):
+        """Initialise les contraintes d'unicité et les index Neo4j"""
+
+        async def _work(tx):
+            for statement in (*CONSTRAINTS, *INDEXES):
+                await tx.run(statement)
+
+        try:
+            async with self.get_session() as session:
+                # Une seule transaction pour toutes les contraintes
+                await session.execute_write(_work)
+                print("✓ Contraintes et index Neo4j initialisés")
         except Exception as e:
             print(f"⚠️  Erreur lors de l'initialisation des contraintes : {e}")
 
-    def execute_query(self, query: str, parameters: dict | None = None):
-        """Exécute une requête Cypher et retourne les résultats"""
-        with self.get_session() as session:
-            result = session.run(query, parameters or {})
-            return list(result)
+    async def execute_query(self, query: str, parameters: dict | None = None):
+        """Exécute une requête Cypher et retourne les résultats (routée comme une écriture)"""
+        return await self.execute_write(query, parameters)
+
+    async def execute_write(self, query: str, parameters: dict | None = None):
+        """Exécute une requête Cypher en écriture sur le leader et invalide le cache"""
+        if self.driver is None:
+            self.connect()
+        records, _, _ = await self.driver.execute_query(
+            query, parameters or {}, database_=self.database, routing_=RoutingControl.WRITE
+        )
+        self.cache.invalidate()
+        return records
+
+    async def execute_read(
+        self,
+        query: str,
+        parameters: dict | None = None,
+        cached: bool = False,
+        parallel: bool = False,
+    ):
+        """
+        Exécute une requête Cypher en lecture (routable vers un réplica)
+
+        Avec ``cached=True`` le résultat est servi depuis le cache TTL+LRU,
+        invalidé à chaque écriture passant par ``execute_write``.
+        Avec ``parallel=True`` (lectures globales d'un graphe) la requête passe par
+        le runtime parallèle si NEO4J_PARALLEL_RUNTIME est activé.
+        """
+        if parallel and self.parallel_runtime:
+            query = f"CYPHER runtime=parallel {query}"
+        key = QueryCache.make_key(query, parameters) if cached else None
+        if key is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+            generation = self.cache.generation
+
+        if self.driver is None:
+            self.connect()
+        records, _, _ = await self.driver.execute_query(
+            query, parameters or {}, database_=self.database, routing_=RoutingControl.READ
+        )
+        if key is not None:
+            self.cache.set(key, query, records, generation)
+        return records
 
 
 # Instance globale
@@ -1,32 +1,40 @@
 """
 Metamodel package - Contains all metamodel-related models
+
+Import paresseux (PEP 562), voir src.models.MDE
 """
 
-from .attribute import Attribute, AttributeCreate, AttributeResponse, AttributeUpdate
-from .concept import Concept, ConceptCreate, ConceptResponse, ConceptUpdate
-from .metamodel import (
-    Metamodel,
-    MetamodelCreate,
-    MetamodelGraphResponse,
-    MetamodelResponse,
-    MetamodelStatus,
-    MetamodelUpdate,
-    MetamodelWithDetails,
-)
-from .metamodel_edge import (
-    MetamodelEdge,
-    MetamodelEdgeCreate,
-    MetamodelEdgeResponse,
-    MetamodelEdgeType,
-    MetamodelEdgeUpdate,
-)
-from .relationship import (
-    Relationship,
-    RelationshipCreate,
-    RelationshipResponse,
-    RelationshipType,
-    RelationshipUpdate,
-)
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_MAP = {
+    "Attribute": ".attribute",
+    "AttributeCreate": ".attribute",
+    "AttributeResponse": ".attribute",
+    "AttributeUpdate": ".attribute",
+    "Concept": ".concept",
+    "ConceptCreate": ".concept",
+    "ConceptResponse": ".concept",
+    "ConceptUpdate": ".concept",
+    "Metamodel": ".metamodel",
+    "MetamodelCreate": ".metamodel",
+    "MetamodelGraphResponse": ".metamodel",
+    "MetamodelResponse": ".metamodel",
+    "MetamodelStatus": ".metamodel",
+    "MetamodelUpdate": ".metamodel",
+    "MetamodelWithDetails": ".metamodel",
+    "MetamodelEdge": ".metamodel_edge",
+    "MetamodelEdgeCreate": ".metamodel_edge",
+    "MetamodelEdgeResponse": ".metamodel_edge",
+    "MetamodelEdgeRow": ".metamodel_edge",
+    "MetamodelEdgeType": ".metamodel_edge",
+    "MetamodelEdgeUpdate": ".metamodel_edge",
+    "Relationship": ".relationship",
+    "RelationshipCreate": ".relationship",
+    "RelationshipResponse": ".relationship",
+    "RelationshipType": ".relationship",
+    "RelationshipUpdate": ".relationship",
+}
 
 __all__ = [
     # Metamodel
@@ -59,4 +67,18 @@ __all__ = [
     "MetamodelEdgeCreate",
     "MetamodelEdgeUpdate",
     "MetamodelEdgeResponse",
+    "MetamodelEdgeRow",
 ]
+
+
+def __getattr__(name: str):
+    module = _MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
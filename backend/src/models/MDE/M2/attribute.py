@@ -7,6 +7,7 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from ...base import ENTITY_CONFIG, NonEmptyStr
 from ...graph import Node
 
 
@@ -64,8 +65,7 @@ class Attribute(Node):
         )
         return base_dict
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
 
 
 # API Schemas
@@ -74,7 +74,7 @@ class Attribute(Node):
 class AttributeCreate(BaseModel):
     """Schema for creating an attribute"""
 
-    name: str = Field(..., min_length=1)
+    name: NonEmptyStr
     type: AttributeType
     description: str | None = None
     is_required: bool = False
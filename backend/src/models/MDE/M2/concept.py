@@ -3,8 +3,9 @@ Concept Model - Represents classes in the metamodel (MDE)
 Simplified for Neo4j graph database
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
+from ...base import ENTITY_CONFIG, NonEmptyStr
 from ...graph import Node
 
 
@@ -28,8 +29,7 @@ class Concept(Node):
         """Return the concept name as display label"""
         return self.name
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
 
 
 # API Schemas
@@ -38,7 +38,7 @@ class Concept(Node):
 class ConceptCreate(BaseModel):
     """Schema for creating a concept"""
 
-    name: str = Field(..., min_length=1)
+    name: NonEmptyStr
     description: str | None = None
     graph_id: str
     x_position: float | None = None
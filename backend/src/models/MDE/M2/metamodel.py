@@ -2,16 +2,27 @@
 Metamodel Model - Container for concepts and relationships (MDE ontology)
 """
 
-from typing import Any, Literal
+from enum import StrEnum
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from ...base import ENTITY_CONFIG, NameStr, VersionStr
 from ...graph import Graph
 from ...graph.edge_type import EdgeType
 from ..M3.m3_config import EDGE_TYPES, NODE_TYPES
 
-# Enums - Keep Literal for backward compatibility
-MetamodelStatus = Literal["draft", "validated", "deprecated"]
+
+class MetamodelStatus(StrEnum):
+    """Lifecycle status of a metamodel"""
+
+    DRAFT = "draft"
+    VALIDATED = "validated"
+    DEPRECATED = "deprecated"
+
+
+# Anciens noms de champs (backward compatibility) -> champ actuel
+_LEGACY_FIELDS = {"concepts": "node_count", "relations": "edge_count"}
 
 
 class Metamodel(Graph):
@@ -31,8 +42,8 @@ class Metamodel(Graph):
     - allowed_node_types, allowed_edge_types (from Graph)
     """
 
-    version: str = Field(..., min_length=1, max_length=50, description="Metamodel version")
-    status: MetamodelStatus = Field(default="draft", description="Metamodel status")
+    version: VersionStr = Field(..., description="Metamodel version")
+    status: MetamodelStatus = Field(default=MetamodelStatus.DRAFT, description="Metamodel status")
     repository_id: str | None = Field(default=None, description="GitHub repository ID")
 
     def __init__(self, **data):
@@ -44,36 +55,45 @@ class Metamodel(Graph):
             data["allowed_edge_types"] = EDGE_TYPES
         super().__init__(**data)
 
-    # Abstract methods implementation
-    def get_graph_type(self) -> str:
-        """Return 'metamodel' as the graph type"""
-        return "metamodel"
+    # Type de graphe (constante de classe, lue par Graph.to_graph_dict)
+    graph_type: ClassVar[str] = "metamodel"
+
+    model_config = ENTITY_CONFIG
+
 
-    class Config:
-        from_attributes = True
+class _LegacyCountsMixin(BaseModel):
+    """Backward compatibility aliases: concepts -> node_count, relations -> edge_count"""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _rename_legacy(cls, data: Any) -> Any:
+        """Accept legacy keys on input, renamed once to the current field names"""
+        if isinstance(data, dict) and any(old in data for old in _LEGACY_FIELDS):
+            data = dict(data)
+            for old, new in _LEGACY_FIELDS.items():
+                if old in data:
+                    value = data.pop(old)
+                    data.setdefault(new, value)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when normal lookup fails: no descriptor on the hot path
+        field = _LEGACY_FIELDS.get(name)
+        if field is not None:
+            return getattr(self, field)
+        return super().__getattr__(name)
 
 
 # Base Model for Create/Update operations
-class MetamodelBase(BaseModel):
-    name: str = Field(..., min_length=1, max_length=200)
+class MetamodelBase(_LegacyCountsMixin):
+    name: NameStr
     description: str | None = None
-    version: str = Field(..., min_length=1, max_length=50)
+    version: VersionStr
     node_count: int = Field(default=0, ge=0, description="Number of concepts")
     edge_count: int = Field(default=0, ge=0, description="Number of relationships")
 
-    # Backward compatibility aliases
-    @property
-    def concepts(self) -> int:
-        """Alias for node_count (backward compatibility)"""
-        return self.node_count
-
-    @property
-    def relations(self) -> int:
-        """Alias for edge_count (backward compatibility)"""
-        return self.edge_count
-
     author: str | None = None
-    status: MetamodelStatus = "draft"
+    status: MetamodelStatus = MetamodelStatus.DRAFT
 
 
 # Create Model
@@ -90,17 +110,13 @@ class MetamodelCreate(MetamodelBase):
 
 
 # Update Model
-class MetamodelUpdate(BaseModel):
-    name: str | None = Field(None, min_length=1, max_length=200)
+class MetamodelUpdate(_LegacyCountsMixin):
+    name: NameStr | None = None
     description: str | None = None
-    version: str | None = Field(None, min_length=1, max_length=50)
+    version: VersionStr | None = None
     node_count: int | None = Field(None, ge=0, description="Number of concepts")
     edge_count: int | None = Field(None, ge=0, description="Number of relationships")
 
-    # Backward compatibility - accept old field names
-    concepts: int | None = Field(None, ge=0, deprecated=True)
-    relations: int | None = Field(None, ge=0, deprecated=True)
-
     author: str | None = None
     status: MetamodelStatus | None = None
     type: str | None = None
@@ -123,15 +139,15 @@ class MetamodelResponse(Metamodel):
 class MetamodelWithDetails(Metamodel):
     """Extended metamodel response with concepts and relationships"""
 
-    concept_list: list[dict[str, Any]] = Field(
-        default_factory=list, description="List of concept details"
+    # Response-only: immutable empty default shared by all instances (no allocation)
+    concept_list: tuple[dict[str, Any], ...] = Field(
+        default=(), description="List of concept details"
     )
-    relationship_list: list[dict[str, Any]] = Field(
-        default_factory=list, description="List of relationship details"
+    relationship_list: tuple[dict[str, Any], ...] = Field(
+        default=(), description="List of relationship details"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
 
 
 class MetamodelGraphResponse(BaseModel):
@@ -149,5 +165,4 @@ class MetamodelGraphResponse(BaseModel):
         default_factory=list, description="Edge type constraints from M3 configuration"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
@@ -2,12 +2,21 @@
 MetamodelEdge - Edges in the metamodel graph (domain, range, has_attribute, etc.)
 """
 
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...graph.edge import Edge
 
+_EDGE_TYPE_DESCRIPTIONS = {
+    "domain": "Définit le concept de domaine d'une relation (source)",
+    "range": "Définit le concept de portée d'une relation (cible)",
+    "has_attribute": "Relie un concept à un de ses attributs",
+    "subclass_of": "Définit une relation d'héritage entre concepts",
+}
+
 
 class MetamodelEdgeType(str, Enum):
     """Types of edges in a metamodel"""
@@ -19,17 +28,21 @@ class MetamodelEdgeType(str, Enum):
 
     def get_display_label(self) -> str:
         """Return the label in UPPERCASE for display (Neo4j convention)"""
-        return self.value.upper()
+        return _EDGE_DISPLAY_LABELS[self]
 
     def get_description(self) -> str:
         """Return human-readable description of this edge type"""
-        descriptions = {
-            "domain": "Définit le concept de domaine d'une relation (source)",
-            "range": "Définit le concept de portée d'une relation (cible)",
-            "has_attribute": "Relie un concept à un de ses attributs",
-            "subclass_of": "Définit une relation d'héritage entre concepts",
-        }
-        return descriptions.get(self.value, "")
+        return _EDGE_TYPE_DESCRIPTIONS.get(self.value, "")
+
+    @classmethod
+    def from_value(cls, value: str) -> "MetamodelEdgeType | None":
+        """Case-insensitive lookup ("DOMAIN" or "domain"), None when unknown"""
+        return _EDGE_TYPES_BY_VALUE.get(value.lower())
+
+
+# Libellés d'affichage calculés une fois (appelés pour chaque edge sérialisé)
+_EDGE_DISPLAY_LABELS = {edge_type: edge_type.value.upper() for edge_type in MetamodelEdgeType}
+_EDGE_TYPES_BY_VALUE = {edge_type.value: edge_type for edge_type in MetamodelEdgeType}
 
 
 class MetamodelEdge(Edge):
@@ -51,20 +64,69 @@ class MetamodelEdge(Edge):
 
     edge_type: MetamodelEdgeType = Field(..., description="Type of metamodel edge")
 
+    # All metamodel edges are directed
+    directed: ClassVar[bool] = True
+
     def get_edge_type(self) -> str:
         """Return the edge type"""
         return self.edge_type.value
 
     def get_display_label(self) -> str:
         """Return the label to display on the edge in UPPERCASE like Neo4j"""
-        return self.edge_type.get_display_label()
+        return _EDGE_DISPLAY_LABELS[self.edge_type]
 
-    def is_directed(self) -> bool:
-        """All metamodel edges are directed"""
-        return True
+    # Immutable once read from Neo4j: updates go through the repository (SET edge += ...)
+    model_config = ConfigDict(frozen=True)
 
-    class Config:
-        from_attributes = True
+
+@dataclass(slots=True, frozen=True)
+class MetamodelEdgeRow:
+    """
+    Lightweight read-only edge, built directly from trusted Neo4j records
+
+    Used on the graph payload path where thousands of edges are loaded only to
+    be serialized: no validation, no per-instance __dict__.
+    """
+
+    id: str
+    name: str
+    edge_type: MetamodelEdgeType
+    source_id: str
+    target_id: str
+    source_label: str | None = None
+    target_label: str | None = None
+    description: str = ""
+
+    def to_model(self, graph_id: str) -> MetamodelEdge:
+        """Promote to a full MetamodelEdge"""
+        return MetamodelEdge(
+            id=self.id,
+            name=self.name,
+            edge_type=self.edge_type,
+            source_id=self.source_id,
+            target_id=self.target_id,
+            source_label=self.source_label,
+            target_label=self.target_label,
+            graph_id=graph_id,
+            description=self.description,
+        )
+
+    def to_graph_dict(self) -> dict[str, Any]:
+        """Same payload as MetamodelEdge.to_graph_dict (edges carry no timestamps in Neo4j)"""
+        display_label = _EDGE_DISPLAY_LABELS[self.edge_type]
+        return {
+            "id": self.id,
+            "description": self.description,
+            "type": display_label,
+            "label": display_label,
+            "source": self.source_id,
+            "target": self.target_id,
+            "source_label": self.source_label,
+            "target_label": self.target_label,
+            "directed": True,
+            "created_at": None,
+            "updated_at": None,
+        }
 
 
 class MetamodelEdgeCreate(BaseModel):
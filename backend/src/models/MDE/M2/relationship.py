@@ -7,6 +7,7 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from ...base import ENTITY_CONFIG, NonEmptyStr
 from ...graph import Node
 
 
@@ -58,15 +59,11 @@ class Relationship(Node):
         Override to include relationship-specific properties
         """
         base_dict = super().to_graph_dict()
-        base_dict.update(
-            {
-                "relationType": self.type.value,  # Type de relation (is_a, has_part, etc.)
-            }
-        )
+        # Type de relation (is_a, has_part, etc.) ; _value_ évite le descripteur Enum.value
+        base_dict["relationType"] = self.type._value_
         return base_dict
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
 
 
 # API Schemas
@@ -78,8 +75,8 @@ class RelationshipCreate(BaseModel):
     Les connexions aux concepts se font via les edges DOMAIN/RANGE dans le graphe Neo4j
     """
 
-    name: str = Field(
-        ..., min_length=1, description="Relationship name (e.g., 'has_parent', 'belongs_to')"
+    name: NonEmptyStr = Field(
+        ..., description="Relationship name (e.g., 'has_parent', 'belongs_to')"
     )
     type: RelationshipType
     description: str | None = None
@@ -91,7 +88,7 @@ class RelationshipCreate(BaseModel):
 class RelationshipUpdate(BaseModel):
     """Schema for updating a relationship"""
 
-    name: str | None = Field(None, min_length=1, description="Relationship name")
+    name: NonEmptyStr | None = Field(None, description="Relationship name")
     type: RelationshipType | None = None
     description: str | None = None
     x_position: float | None = None
@@ -98,6 +98,36 @@ EDGE_TYPES_BY_ID: dict[str, EdgeType] = {et.name: et for et in EDGE_TYPES}
 # ==================== M3 CONFIGURATION ====================
 
 
+def _build_edge_constraints() -> list[dict]:
+    """Expand EDGE_TYPES into one constraint per (source, target) combination"""
+    constraints = []
+    for edge_type in EDGE_TYPES:
+        label = edge_type.name.upper()  # Uppercase for display
+        for source_type in edge_type.sourceNodeTypes:
+            for target_type in edge_type.targetNodeTypes:
+                constraints.append(
+                    {
+                        "edgeType": label,
+                        "label": label,
+                        "sourceNodeType": source_type,
+                        "targetNodeType": target_type,
+                        "directed": edge_type.directed,
+                    }
+                )
+    return constraints
+
+
+_EDGE_CONSTRAINTS = _build_edge_constraints()
+
+# (edge type, source type, target type) autorisés : validation en une recherche de hash
+_ALLOWED_CONNECTIONS = frozenset(
+    (edge_type.name, source_type, target_type)
+    for edge_type in EDGE_TYPES
+    for source_type in edge_type.sourceNodeTypes
+    for target_type in edge_type.targetNodeTypes
+)
+
+
 class M3Config:
     """
     M3 Configuration class providing access to all metamodel types
@@ -136,21 +166,11 @@ class M3Config:
             "targetNodeType": "concept",
             "directed": true
         }
+
+        The list is computed once at import time (EDGE_TYPES is immutable)
+        and shared: callers must not mutate it.
         """
-        constraints = []
-        for edge_type in EDGE_TYPES:
-            for source_type in edge_type.sourceNodeTypes:
-                for target_type in edge_type.targetNodeTypes:
-                    constraints.append(
-                        {
-                            "edgeType": edge_type.name.upper(),  # Uppercase for display
-                            "label": edge_type.name.upper(),
-                            "sourceNodeType": source_type,
-                            "targetNodeType": target_type,
-                            "directed": edge_type.directed,
-                        }
-                    )
-        return constraints
+        return _EDGE_CONSTRAINTS
 
     @staticmethod
     def validate_edge(edge_type_id: str, source_type_id: str, target_type_id: str) -> bool:
@@ -165,8 +185,4 @@ class M3Config:
         Returns:
             True if the connection is valid, False otherwise
         """
-        edge_type = EDGE_TYPES_BY_ID.get(edge_type_id)
-        if not edge_type:
-            return False
-
-        return edge_type.allows_connection(source_type_id, target_type_id)
+        return (edge_type_id, source_type_id, target_type_id) in _ALLOWED_CONNECTIONS
@@ -1,38 +1,41 @@
 """
 MDE (Model-Driven Engineering) models
+
+Les sous-modules sont importés à la demande (PEP 562) : importer un seul
+modèle ne compile pas les classes Pydantic des autres.
 """
 
-from .M2.attribute import (
-    Attribute,
-    AttributeCreate,
-    AttributeResponse,
-    AttributeType,
-    AttributeUpdate,
-)
-from .M2.concept import Concept, ConceptCreate, ConceptResponse, ConceptUpdate
-from .M2.metamodel import (
-    Metamodel,
-    MetamodelCreate,
-    MetamodelGraphResponse,
-    MetamodelResponse,
-    MetamodelStatus,
-    MetamodelUpdate,
-    MetamodelWithDetails,
-)
-from .M2.metamodel_edge import (
-    MetamodelEdge,
-    MetamodelEdgeCreate,
-    MetamodelEdgeResponse,
-    MetamodelEdgeType,
-    MetamodelEdgeUpdate,
-)
-from .M2.relationship import (
-    Relationship,
-    RelationshipCreate,
-    RelationshipResponse,
-    RelationshipType,
-    RelationshipUpdate,
-)
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_MAP = {
+    "Attribute": ".M2.attribute",
+    "AttributeCreate": ".M2.attribute",
+    "AttributeResponse": ".M2.attribute",
+    "AttributeType": ".M2.attribute",
+    "AttributeUpdate": ".M2.attribute",
+    "Concept": ".M2.concept",
+    "ConceptCreate": ".M2.concept",
+    "ConceptResponse": ".M2.concept",
+    "ConceptUpdate": ".M2.concept",
+    "Metamodel": ".M2.metamodel",
+    "MetamodelCreate": ".M2.metamodel",
+    "MetamodelGraphResponse": ".M2.metamodel",
+    "MetamodelResponse": ".M2.metamodel",
+    "MetamodelStatus": ".M2.metamodel",
+    "MetamodelUpdate": ".M2.metamodel",
+    "MetamodelWithDetails": ".M2.metamodel",
+    "MetamodelEdge": ".M2.metamodel_edge",
+    "MetamodelEdgeCreate": ".M2.metamodel_edge",
+    "MetamodelEdgeResponse": ".M2.metamodel_edge",
+    "MetamodelEdgeType": ".M2.metamodel_edge",
+    "MetamodelEdgeUpdate": ".M2.metamodel_edge",
+    "Relationship": ".M2.relationship",
+    "RelationshipCreate": ".M2.relationship",
+    "RelationshipResponse": ".M2.relationship",
+    "RelationshipType": ".M2.relationship",
+    "RelationshipUpdate": ".M2.relationship",
+}
 
 __all__ = [
     # Metamodel
@@ -67,3 +70,16 @@ __all__ = [
     "MetamodelEdgeUpdate",
     "MetamodelEdgeResponse",
 ]
+
+
+def __getattr__(name: str):
+    module = _MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,39 +1,59 @@
 """
 Pydantic models for all entities
+
+Import paresseux (PEP 562) : chaque sous-module n'est chargé qu'au premier accès
+à l'un de ses modèles.
 """
 
-from .base import BaseEntity, TimestampMixin
-from .MDE import (
-    Attribute,
-    AttributeCreate,
-    AttributeResponse,
-    AttributeType,
-    AttributeUpdate,
-    Concept,
-    ConceptCreate,
-    ConceptResponse,
-    ConceptUpdate,
-    Metamodel,
-    MetamodelCreate,
-    MetamodelEdge,
-    MetamodelEdgeCreate,
-    MetamodelEdgeResponse,
-    MetamodelEdgeType,
-    MetamodelEdgeUpdate,
-    MetamodelGraphResponse,
-    MetamodelResponse,
-    MetamodelStatus,
-    MetamodelUpdate,
-    Relationship,
-    RelationshipCreate,
-    RelationshipResponse,
-    RelationshipType,
-    RelationshipUpdate,
-)
-from .oauth.user import User, UserCreate, UserPublic, UserUpdate
-from .repository.issue import Issue, IssueCreate, IssuePriority, IssueStatus, IssueType, IssueUpdate
-from .repository.message import Message, MessageAuthorType, MessageCreate, MessageUpdate
-from .repository.repository import Repository, RepositoryCreate, RepositoryUpdate
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_MAP = {
+    "BaseEntity": ".base",
+    "TimestampMixin": ".base",
+    "Attribute": ".MDE.M2.attribute",
+    "AttributeCreate": ".MDE.M2.attribute",
+    "AttributeResponse": ".MDE.M2.attribute",
+    "AttributeType": ".MDE.M2.attribute",
+    "AttributeUpdate": ".MDE.M2.attribute",
+    "Concept": ".MDE.M2.concept",
+    "ConceptCreate": ".MDE.M2.concept",
+    "ConceptResponse": ".MDE.M2.concept",
+    "ConceptUpdate": ".MDE.M2.concept",
+    "Metamodel": ".MDE.M2.metamodel",
+    "MetamodelCreate": ".MDE.M2.metamodel",
+    "MetamodelGraphResponse": ".MDE.M2.metamodel",
+    "MetamodelResponse": ".MDE.M2.metamodel",
+    "MetamodelStatus": ".MDE.M2.metamodel",
+    "MetamodelUpdate": ".MDE.M2.metamodel",
+    "MetamodelEdge": ".MDE.M2.metamodel_edge",
+    "MetamodelEdgeCreate": ".MDE.M2.metamodel_edge",
+    "MetamodelEdgeResponse": ".MDE.M2.metamodel_edge",
+    "MetamodelEdgeType": ".MDE.M2.metamodel_edge",
+    "MetamodelEdgeUpdate": ".MDE.M2.metamodel_edge",
+    "Relationship": ".MDE.M2.relationship",
+    "RelationshipCreate": ".MDE.M2.relationship",
+    "RelationshipResponse": ".MDE.M2.relationship",
+    "RelationshipType": ".MDE.M2.relationship",
+    "RelationshipUpdate": ".MDE.M2.relationship",
+    "User": ".oauth.user",
+    "UserCreate": ".oauth.user",
+    "UserPublic": ".oauth.user",
+    "UserUpdate": ".oauth.user",
+    "Issue": ".repository.issue",
+    "IssueCreate": ".repository.issue",
+    "IssuePriority": ".repository.issue",
+    "IssueStatus": ".repository.issue",
+    "IssueType": ".repository.issue",
+    "IssueUpdate": ".repository.issue",
+    "Message": ".repository.message",
+    "MessageAuthorType": ".repository.message",
+    "MessageCreate": ".repository.message",
+    "MessageUpdate": ".repository.message",
+    "Repository": ".repository.repository",
+    "RepositoryCreate": ".repository.repository",
+    "RepositoryUpdate": ".repository.repository",
+}
 
 __all__ = [
     # Base
@@ -85,3 +105,16 @@ __all__ = [
     "RelationshipResponse",
     "RelationshipType",
 ]
+
+
+def __getattr__(name: str):
+    module = _MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,26 +2,66 @@
 Base models for all entities
 """
 
-from datetime import datetime
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# Config partagée par les entités. Elles sont toujours validées depuis des dicts
+# (records Neo4j, payloads API) : pas de from_attributes.
+# defer_build : le schéma pydantic-core n'est construit qu'à la première utilisation
+ENTITY_CONFIG = ConfigDict(defer_build=True)
+
+# Contraintes de chaînes partagées par les schémas Create/Update
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+NameStr = Annotated[str, Field(min_length=1, max_length=200)]
+VersionStr = Annotated[str, Field(min_length=1, max_length=50)]
+
+# IDs/types répétés sur chaque nœud/arête d'un graphe : un seul objet str par valeur
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Horodatage partagé par toutes les entités créées dans un même lot
+_batch_now: ContextVar[datetime | None] = ContextVar("_batch_now", default=None)
+
+
+def utc_now() -> datetime:
+    """Current UTC time (naive, as stored so far), or the enclosing batch time"""
+    batch_now = _batch_now.get()
+    if batch_now is not None:
+        return batch_now
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[datetime]:
+    """Freeze utc_now() for the duration of a bulk operation (one clock read per batch)"""
+    token = _batch_now.set(datetime.now(UTC).replace(tzinfo=None))
+    try:
+        yield _batch_now.get()
+    finally:
+        _batch_now.reset(token)
 
 
 class TimestampMixin(BaseModel):
     """Mixin for timestamps"""
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime | None = None
 
+    model_config = ENTITY_CONFIG
+
 
 class BaseEntity(TimestampMixin):
     """Base for all entities"""
 
     id: str = Field(..., description="Unique identifier")
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
 
 
 class GenderType(str, Enum):
@@ -37,3 +77,11 @@ class BaseSemanticModel(BaseModel):
 
     name: str = Field(..., description="Unique identifier name")
     description: str = Field(default="", description="Human-readable description")
+
+    model_config = ENTITY_CONFIG
+
+
+class SemanticEntity(BaseEntity, BaseSemanticModel):
+    """Base for named entities (id, timestamps, name, description)"""
+
+    model_config = ENTITY_CONFIG
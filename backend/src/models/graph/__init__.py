@@ -1,13 +1,34 @@
 """
 Graph Models Package - Abstract classes for graph structures
+
+Les sous-modules sont importés à la demande (PEP 562) : importer Node ne
+compile pas Graph ni Edge.
 """
 
-from .edge import Edge
-from .graph import Graph
-from .node import Node
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_MAP = {
+    "Graph": ".graph",
+    "Node": ".node",
+    "Edge": ".edge",
+}
 
 __all__ = [
     "Graph",
     "Node",
     "Edge",
 ]
+
+
+def __getattr__(name: str):
+    module = _MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,11 +3,11 @@ Edge - Abstract base class for graph edges
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import Field
 
-from ..base import BaseEntity, BaseSemanticModel
+from ..base import ENTITY_CONFIG, BaseEntity, BaseSemanticModel, InternedStr
 
 
 class Edge(BaseEntity, BaseSemanticModel, ABC):
@@ -23,12 +23,12 @@ class Edge(BaseEntity, BaseSemanticModel, ABC):
     """
 
     # Graph metadata
-    graph_id: str = Field(..., description="ID of the parent graph (metamodel)")
-    edge_type: str = Field(..., description="Type of this edge")
+    graph_id: InternedStr = Field(..., description="ID of the parent graph (metamodel)")
+    edge_type: InternedStr = Field(..., description="Type of this edge")
 
     # Source and target nodes
-    source_id: str = Field(..., description="ID of the source node")
-    target_id: str = Field(..., description="ID of the target node")
+    source_id: InternedStr = Field(..., description="ID of the source node")
+    target_id: InternedStr = Field(..., description="ID of the target node")
 
     # Optional labels
     source_label: str | None = Field(default=None, description="Label of source node (cached)")
@@ -50,13 +50,15 @@ class Edge(BaseEntity, BaseSemanticModel, ABC):
         """
         pass
 
-    @abstractmethod
+    # True si l'arête est orientée, défini par chaque sous-classe
+    directed: ClassVar[bool]
+
     def is_directed(self) -> bool:
         """
         Return True if this edge is directed (has a specific direction)
         Return False for undirected edges
         """
-        pass
+        return self.directed
 
     def get_endpoints(self) -> tuple[str, str]:
         """Get the (source_id, target_id) endpoints of this edge"""
@@ -81,10 +83,9 @@ class Edge(BaseEntity, BaseSemanticModel, ABC):
             "target": self.target_id,
             "source_label": self.source_label,
             "target_label": self.target_label,
-            "directed": self.is_directed(),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "directed": self.directed,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
@@ -2,15 +2,21 @@
 Graph - Abstract base class for graph structures
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import ABC
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from ..base import BaseEntity, BaseSemanticModel
+from ..base import ENTITY_CONFIG, BaseEntity, BaseSemanticModel
 from .edge_type import EdgeType
 from .node_type import NodeType
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .edge import Edge
+    from .node import Node
+
 
 class Graph(BaseEntity, BaseSemanticModel, ABC):
     """
@@ -44,31 +50,109 @@ class Graph(BaseEntity, BaseSemanticModel, ABC):
         default_factory=list, description="List of allowed edge types in this graph"
     )
 
-    @abstractmethod
+    # Vues tableau construites à la demande, non sérialisées, chacune avec sa durée de vie :
+    # adjacence CSR (indptr, indices) et positions (N, 2) indexées par _position_idx
+    _csr: "tuple[np.ndarray, np.ndarray] | None" = PrivateAttr(default=None)
+    _positions: "np.ndarray | None" = PrivateAttr(default=None)
+    _position_idx: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    # Type du graphe (metamodel, knowledge_graph, etc.), défini par chaque sous-classe
+    graph_type: ClassVar[str]
+
     def get_graph_type(self) -> str:
-        """
-        Return the type of this graph (metamodel, knowledge_graph, etc.)
-        Must be implemented by subclasses
-        """
-        pass
+        """Return the type of this graph (metamodel, knowledge_graph, etc.)"""
+        return self.graph_type
 
+    # Compteurs : écriture directe dans __dict__ (pas de __setattr__ pydantic)
     def increment_node_count(self) -> None:
         """Increment the node count"""
-        self.node_count += 1
+        self.__dict__["node_count"] += 1
 
     def decrement_node_count(self) -> None:
         """Decrement the node count"""
-        if self.node_count > 0:
-            self.node_count -= 1
+        self.__dict__["node_count"] = max(0, self.__dict__["node_count"] - 1)
 
     def increment_edge_count(self) -> None:
         """Increment the edge count"""
-        self.edge_count += 1
+        self.__dict__["edge_count"] += 1
 
     def decrement_edge_count(self) -> None:
         """Decrement the edge count"""
-        if self.edge_count > 0:
-            self.edge_count -= 1
+        self.__dict__["edge_count"] = max(0, self.__dict__["edge_count"] - 1)
+
+    def bulk_update(self, node_delta: int = 0, edge_delta: int = 0) -> None:
+        """Appliquer les variations de compteurs d'un lot en une fois (bornées à 0)"""
+        counts = self.__dict__
+        counts["node_count"] = max(0, counts["node_count"] + node_delta)
+        counts["edge_count"] = max(0, counts["edge_count"] + edge_delta)
+
+    def build_csr(
+        self, nodes: "list[Node]", edges: "list[Edge]"
+    ) -> "tuple[np.ndarray, np.ndarray]":
+        """
+        Construire l'adjacence sortante au format CSR (int32)
+
+        Les IDs sont remplacés par des indices compacts (ordre de `nodes`) ;
+        les voisins de v sont indices[indptr[v]:indptr[v + 1]].
+        Les arêtes dont une extrémité est absente de `nodes` sont ignorées.
+        """
+        import numpy as np
+
+        index = {node.id: i for i, node in enumerate(nodes)}
+        pairs = [
+            (index[edge.source_id], index[edge.target_id])
+            for edge in edges
+            if edge.source_id in index and edge.target_id in index
+        ]
+        sources = np.fromiter((s for s, _ in pairs), dtype=np.int32, count=len(pairs))
+        targets = np.fromiter((t for _, t in pairs), dtype=np.int32, count=len(pairs))
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=len(nodes)), out=indptr[1:])
+        indices = targets[np.argsort(sources, kind="stable")]
+
+        self._csr = (indptr, indices)
+        return self._csr
+
+    def neighbors(self, v: int) -> "np.ndarray":
+        """
+        Voisins sortants du nœud d'indice v (vue sans copie sur le tableau CSR)
+
+        v est la position du nœud dans la liste passée au dernier build_csr().
+        """
+        if self._csr is None:
+            raise RuntimeError("Adjacency not built, call build_csr() first")
+        indptr, indices = self._csr
+        return indices[indptr[v] : indptr[v + 1]]
+
+    def build_positions(self, nodes: "list[Node]") -> "np.ndarray":
+        """
+        Regrouper les positions des nœuds dans un tableau float32 (N, 2)
+
+        Ligne i = (x, y) du nœud d'indice i ; NaN pour un nœud non placé.
+        Les algorithmes de layout travaillent ensuite sur le tableau entier.
+        """
+        import numpy as np
+
+        positions = np.array(
+            [
+                (
+                    np.nan if node.x_position is None else node.x_position,
+                    np.nan if node.y_position is None else node.y_position,
+                )
+                for node in nodes
+            ],
+            dtype=np.float32,
+        ).reshape(len(nodes), 2)
+        self._positions = positions
+        self._position_idx = {node.id: i for i, node in enumerate(nodes)}
+        return positions
+
+    def get_node_position(self, node_id: str) -> "np.ndarray":
+        """Position (x, y) d'un nœud : vue sur la ligne du tableau de positions"""
+        if self._positions is None:
+            raise RuntimeError("Positions not built, call build_positions() first")
+        return self._positions[self._position_idx[node_id]]
 
     def get_metrics(self) -> dict[str, int]:
         """Get graph metrics"""
@@ -86,7 +170,7 @@ class Graph(BaseEntity, BaseSemanticModel, ABC):
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "type": self.get_graph_type(),
+            "type": self.graph_type,
             "allowed_node_types": [nt.model_dump() for nt in self.allowed_node_types],
             "allowed_edge_types": [et.model_dump() for et in self.allowed_edge_types],
             "metrics": self.get_metrics(),
@@ -95,5 +179,4 @@ class Graph(BaseEntity, BaseSemanticModel, ABC):
             "updated_at": self.updated_at,
         }
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
@@ -7,7 +7,7 @@ from typing import Any
 
 from pydantic import Field
 
-from ..base import BaseEntity, BaseSemanticModel
+from ..base import ENTITY_CONFIG, BaseEntity, BaseSemanticModel, InternedStr
 from .node_type import NodeType
 
 
@@ -24,7 +24,7 @@ class Node(BaseEntity, BaseSemanticModel, ABC):
     """
 
     # Graph metadata
-    graph_id: str = Field(..., description="ID of the parent graph (metamodel)")
+    graph_id: InternedStr = Field(..., description="ID of the parent graph (metamodel)")
     node_type: NodeType = Field(..., description="Type definition of this node (M3 metadata)")
 
     # Position for graph visualization
@@ -65,9 +65,8 @@ class Node(BaseEntity, BaseSemanticModel, ABC):
             "label": self.get_display_label(),
             "x": self.x_position,
             "y": self.y_position,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
-    class Config:
-        from_attributes = True
+    model_config = ENTITY_CONFIG
@@ -2,7 +2,7 @@
 NodeType - M3 Base class for semantic node types
 """
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from ..base import BaseSemanticModel, GenderType
 
@@ -27,5 +27,4 @@ class NodeType(BaseSemanticModel):
         """Return article with capital letter"""
         return self.article.capitalize()
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
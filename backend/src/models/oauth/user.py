@@ -2,16 +2,23 @@
 User model - OAuth2 Authentication
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints
 
 from ..base import BaseEntity
 
+# Adresses issues de GitHub OAuth : contrôle de forme seulement, sans email-validator
+# (la regex est compilée une fois dans le schéma pydantic-core)
+_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[str, StringConstraints(pattern=_EMAIL_PATTERN, max_length=254)]
+
 
 class User(BaseEntity):
     """User model for OAuth2 authentication"""
 
     username: str = Field(..., min_length=3, max_length=50, description="GitHub username")
-    email: EmailStr | None = Field(None, description="Email address")
+    email: Email | None = Field(None, description="Email address")
     avatar_url: str | None = Field(None, description="Avatar URL")
     github_id: int | None = Field(None, description="GitHub user ID")
     github_token: str | None = Field(
@@ -25,7 +32,7 @@ class UserPublic(BaseModel):
 
     id: str
     username: str
-    email: EmailStr | None
+    email: Email | None
     avatar_url: str | None
     is_active: bool
     github_token: bool | None = Field(
@@ -35,7 +42,8 @@ class UserPublic(BaseModel):
     @staticmethod
     def from_user(user: "User") -> "UserPublic":
         """Create UserPublic from User, hiding the actual token value"""
-        return UserPublic(
+        # Champs déjà validés par User : construction directe, sans revalidation
+        return UserPublic.model_construct(
             id=user.id,
             username=user.username,
             email=user.email,
@@ -49,13 +57,13 @@ class UserCreate(BaseModel):
     """Data needed to create a user"""
 
     username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr | None = None
+    email: Email | None = None
     github_id: int | None = None
 
 
 class UserUpdate(BaseModel):
     """Data for updating a user"""
 
-    email: EmailStr | None = None
+    email: Email | None = None
     avatar_url: str | None = None
     is_active: bool | None = None
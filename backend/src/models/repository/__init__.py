@@ -1,6 +1,21 @@
-from .issue import Issue, IssueCreate, IssueUpdate
-from .message import Message, MessageCreate, MessageUpdate
-from .repository import Repository, RepositoryCreate, RepositoryUpdate
+"""
+Repository models (import paresseux, voir src.models)
+"""
+
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_MAP = {
+    "Issue": ".issue",
+    "IssueCreate": ".issue",
+    "IssueUpdate": ".issue",
+    "Message": ".message",
+    "MessageCreate": ".message",
+    "MessageUpdate": ".message",
+    "Repository": ".repository",
+    "RepositoryCreate": ".repository",
+    "RepositoryUpdate": ".repository",
+}
 
 __all__ = [
     "IssueCreate",
@@ -13,3 +28,16 @@ __all__ = [
     "RepositoryUpdate",
     "Repository",
 ]
+
+
+def __getattr__(name: str):
+    module = _MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -7,14 +7,14 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from ..base import BaseEntity, BaseSemanticModel
+from ..base import SemanticEntity
 
 IssueStatus = Literal["open", "in_progress", "review", "closed", "cancelled"]
 IssuePriority = Literal["low", "medium", "high", "urgent"]
 IssueType = Literal["bug", "feature", "documentation", "refactor"]
 
 
-class Issue(BaseEntity, BaseSemanticModel):
+class Issue(SemanticEntity):
     """Issue model (1 Issue = 1 Branch = 1 PR)"""
 
     # Relations
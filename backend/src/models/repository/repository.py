@@ -4,10 +4,10 @@ Repository model - GitHub repositories
 
 from pydantic import BaseModel, Field
 
-from ..base import BaseEntity, BaseSemanticModel
+from ..base import SemanticEntity
 
 
-class Repository(BaseEntity, BaseSemanticModel):
+class Repository(SemanticEntity):
     """GitHub repository model"""
 
     full_name: str = Field(..., description="owner/repo")
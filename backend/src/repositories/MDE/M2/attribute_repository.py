@@ -24,6 +24,10 @@ class AttributeRepository(BaseRepository[Attribute]):
         data["node_type"] = ATTRIBUTE_NODE_TYPE
         return data
 
+    def _prepare_row(self, data: dict[str, Any]) -> dict[str, Any]:
+        """node_type is not stored in Neo4j"""
+        return self._add_node_type(data)
+
     async def create(self, data: dict[str, Any]) -> Attribute:
         """
         Create a new attribute with HAS_ATTRIBUTE relationship to metamodel
@@ -66,7 +70,7 @@ class AttributeRepository(BaseRepository[Attribute]):
             """
             params = {"props": prepared_data}
 
-        result = self.db.execute_query(query, params)
+        result = await self.db.execute_write(query, params)
 
         if not result:
             raise ValueError(f"Failed to create {self.label}")
@@ -127,7 +131,7 @@ class AttributeRepository(BaseRepository[Attribute]):
             """
             params = {"props": prepared_data, "concept_id": concept_id}
 
-        result = self.db.execute_query(query, params)
+        result = await self.db.execute_write(query, params)
         if not result:
             raise ValueError("Failed to create Attribute")
 
@@ -158,10 +162,10 @@ class AttributeRepository(BaseRepository[Attribute]):
         SKIP $skip
         LIMIT $limit
         """
-        result = self.db.execute_query(
-            query, {"concept_id": concept_id, "skip": skip, "limit": limit}
+        result = await self.db.execute_read(
+            query, {"concept_id": concept_id, "skip": skip, "limit": limit}, parallel=True
         )
-        return [self.model(**self._add_node_type(convert_neo4j_types(row["a"]))) for row in result]
+        return self._from_rows(row["a"] for row in result)
 
     async def get_by_metamodel(
         self, metamodel_id: str, skip: int = 0, limit: int = 100
@@ -184,10 +188,10 @@ class AttributeRepository(BaseRepository[Attribute]):
         SKIP $skip
         LIMIT $limit
         """
-        result = self.db.execute_query(
-            query, {"metamodel_id": metamodel_id, "skip": skip, "limit": limit}
+        result = await self.db.execute_read(
+            query, {"metamodel_id": metamodel_id, "skip": skip, "limit": limit}, parallel=True
         )
-        return [self.model(**self._add_node_type(convert_neo4j_types(row["a"]))) for row in result]
+        return self._from_rows(row["a"] for row in result)
 
     async def get_by_name(self, concept_id: str, name: str) -> Attribute | None:
         """
@@ -204,10 +208,10 @@ class AttributeRepository(BaseRepository[Attribute]):
         MATCH (a:Attribute {name: $name})-[:ATTRIBUTE_OF]->(c:Concept {id: $concept_id})
         RETURN a
         """
-        result = self.db.execute_query(query, {"concept_id": concept_id, "name": name})
+        result = await self.db.execute_read(query, {"concept_id": concept_id, "name": name})
         if not result:
             return None
-        return self.model(**self._add_node_type(convert_neo4j_types(result[0]["a"])))
+        return self._from_row(result[0]["a"])
 
     async def get_required_attributes(self, concept_id: str) -> list[Attribute]:
         """
@@ -224,8 +228,8 @@ class AttributeRepository(BaseRepository[Attribute]):
         RETURN a
         ORDER BY a.created_at ASC
         """
-        result = self.db.execute_query(query, {"concept_id": concept_id})
-        return [self.model(**self._add_node_type(convert_neo4j_types(row["a"]))) for row in result]
+        result = await self.db.execute_read(query, {"concept_id": concept_id}, parallel=True)
+        return self._from_rows(row["a"] for row in result)
 
     async def count_by_concept(self, concept_id: str) -> int:
         """
@@ -241,7 +245,7 @@ class AttributeRepository(BaseRepository[Attribute]):
         MATCH (a:Attribute)-[:ATTRIBUTE_OF]->(c:Concept {id: $concept_id})
         RETURN count(a) as count
         """
-        result = self.db.execute_query(query, {"concept_id": concept_id})
+        result = await self.db.execute_read(query, {"concept_id": concept_id}, parallel=True)
         return result[0]["count"] if result else 0
 
     async def delete_all_by_metamodel(self, metamodel_id: str) -> int:
@@ -252,7 +256,7 @@ class AttributeRepository(BaseRepository[Attribute]):
         DETACH DELETE a
         RETURN node_count as deleted
         """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
+        result = await self.db.execute_write(query, {"metamodel_id": metamodel_id})
         deleted = result[0]["deleted"] if result else 0
         logger.info(f"Deleted {deleted} attributes for metamodel {metamodel_id}")
         return deleted
@@ -272,7 +276,7 @@ class AttributeRepository(BaseRepository[Attribute]):
         DETACH DELETE a
         RETURN count(a) as deleted
         """
-        result = self.db.execute_query(query, {"id": entity_id})
+        result = await self.db.execute_write(query, {"id": entity_id})
         deleted = result[0]["deleted"] > 0
 
         if deleted:
@@ -12,18 +12,99 @@ from ...base import BaseRepository, convert_neo4j_types, prepare_neo4j_propertie
 
 logger = logging.getLogger(__name__)
 
+# Requêtes constantes (label fixe) : construites une fois, plan réutilisé côté Neo4j
+CREATE_WITH_METAMODEL_QUERY = """
+CREATE (c:Concept $props)
+SET c.created_at = datetime()
+WITH c
+MATCH (m:Metamodel {id: $graph_id})
+CREATE (m)-[r:HAS_CONCEPT]->(c)
+RETURN c
+"""
+CREATE_QUERY = """
+CREATE (c:Concept $props)
+SET c.created_at = datetime()
+RETURN c
+"""
+BULK_CREATE_QUERY = """
+UNWIND $batch AS props
+CREATE (c:Concept)
+SET c = props, c.created_at = datetime()
+WITH c
+MATCH (m:Metamodel {id: c.graph_id})
+CREATE (m)-[:HAS_CONCEPT]->(c)
+RETURN c
+"""
+DELETE_QUERY = """
+MATCH (c:Concept {id: $id})
+WITH c, count(c) as node_count
+DETACH DELETE c
+RETURN node_count as deleted
+"""
+GET_BY_METAMODEL_QUERY = """
+MATCH (c:Concept {graph_id: $metamodel_id})
+RETURN c
+ORDER BY c.created_at DESC
+SKIP $skip
+LIMIT $limit
+"""
+GET_BY_NAME_QUERY = """
+MATCH (c:Concept {graph_id: $metamodel_id, name: $name})
+RETURN c
+"""
+UPDATE_POSITION_QUERY = """
+MATCH (c:Concept {id: $id})
+SET c.x = $x, c.y = $y
+SET c.updated_at = datetime()
+RETURN c
+"""
+GET_WITH_ATTRIBUTES_QUERY = """
+MATCH (c:Concept {id: $id})
+OPTIONAL MATCH (c)<-[:ATTRIBUTE_OF]-(a:Attribute)
+RETURN c, collect(a) as attributes
+"""
+COUNT_BY_METAMODEL_QUERY = """
+MATCH (c:Concept {graph_id: $metamodel_id})
+RETURN count(c) as count
+"""
+# Two aggregating subqueries: always exactly one row, even for an empty page
+LIST_WITH_TOTAL_QUERY = """
+CALL {
+    MATCH (c:Concept {graph_id: $metamodel_id})
+    RETURN count(c) AS total
+}
+CALL {
+    MATCH (c:Concept {graph_id: $metamodel_id})
+    WITH c ORDER BY c.created_at DESC SKIP $skip LIMIT $limit
+    RETURN collect(c) AS items
+}
+RETURN items, total
+"""
+DELETE_ALL_BY_METAMODEL_QUERY = """
+MATCH (c:Concept {graph_id: $metamodel_id})
+WITH c, count(c) as node_count
+DETACH DELETE c
+RETURN node_count as deleted
+"""
+
 
 class ConceptRepository(BaseRepository[Concept]):
     """Repository for concept CRUD operations"""
 
+    _node_type = CONCEPT_NODE_TYPE
+
     def __init__(self, db):
         super().__init__(db, Concept, "Concept")
 
     def _add_node_type(self, data: dict[str, Any]) -> dict[str, Any]:
         """Add node_type to concept data"""
-        data["node_type"] = CONCEPT_NODE_TYPE
+        data["node_type"] = self._node_type
         return data
 
+    def _prepare_row(self, data: dict[str, Any]) -> dict[str, Any]:
+        """node_type is not stored in Neo4j"""
+        return self._add_node_type(data)
+
     async def create(self, data: dict[str, Any]) -> Concept:
         """
         Create a new concept with HAS_CONCEPT relationship to metamodel
@@ -34,7 +115,7 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Created concept
         """
-        logger.info(f"🔍 Creating concept: {data.get('name')}")
+        logger.info("🔍 Creating concept: %s", data.get("name"))
 
         # Prepare data for Neo4j
         prepared_data = prepare_neo4j_properties(data)
@@ -44,39 +125,43 @@ class ConceptRepository(BaseRepository[Concept]):
 
         # Create concept node and HAS_CONCEPT relationship
         if graph_id:
-            query = f"""
-            // Create concept node
-            CREATE (c:{self.label} $props)
-            SET c.created_at = datetime()
-            
-            // Find metamodel and create HAS_CONCEPT relationship
-            WITH c
-            MATCH (m:Metamodel {{id: $graph_id}})
-            CREATE (m)-[r:HAS_CONCEPT]->(c)
-            
-            RETURN c
-            """
+            query = CREATE_WITH_METAMODEL_QUERY
             params = {"props": prepared_data, "graph_id": graph_id}
         else:
             # Fallback to standard creation without relationship
-            query = f"""
-            CREATE (c:{self.label} $props)
-            SET c.created_at = datetime()
-            RETURN c
-            """
+            query = CREATE_QUERY
             params = {"props": prepared_data}
 
-        result = self.db.execute_query(query, params)
+        result = await self.db.execute_write(query, params)
 
         if not result:
             raise ValueError(f"Failed to create {self.label}")
 
         node = convert_neo4j_types(result[0]["c"])
         logger.info(
-            f"✅ Created {self.label} with id={node.get('id')} and HAS_CONCEPT relationship"
+            "✅ Created %s with id=%s and HAS_CONCEPT relationship", self.label, node.get("id")
         )
         return self.model(**self._add_node_type(node))
 
+    async def bulk_create(self, items: list[dict[str, Any]]) -> list[Concept]:
+        """
+        Create many concepts in one query (UNWIND), with their HAS_CONCEPT relationships
+
+        Args:
+            items: Concept data, each including the graph_id of an existing metamodel
+
+        Returns:
+            Created concepts
+        """
+        if not items:
+            return []
+
+        batch = [prepare_neo4j_properties(item) for item in items]
+        result = await self.db.execute_write(BULK_CREATE_QUERY, {"batch": batch})
+
+        logger.info("✅ Created %d %s nodes in one batch", len(result), self.label)
+        return self._from_rows(row["c"] for row in result)
+
     async def get_by_metamodel(
         self, metamodel_id: str, skip: int = 0, limit: int = 100
     ) -> list[Concept]:
@@ -91,17 +176,12 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             List of concepts
         """
-        query = """
-        MATCH (c:Concept {graph_id: $metamodel_id})
-        RETURN c
-        ORDER BY c.created_at DESC
-        SKIP $skip
-        LIMIT $limit
-        """
-        result = self.db.execute_query(
-            query, {"metamodel_id": metamodel_id, "skip": skip, "limit": limit}
+        result = await self.db.execute_read(
+            GET_BY_METAMODEL_QUERY,
+            {"metamodel_id": metamodel_id, "skip": skip, "limit": limit},
+            parallel=True,
         )
-        return [self.model(**self._add_node_type(convert_neo4j_types(row["c"]))) for row in result]
+        return self._from_rows(row["c"] for row in result)
 
     async def get_by_name(self, metamodel_id: str, name: str) -> Concept | None:
         """
@@ -114,14 +194,12 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Concept or None
         """
-        query = """
-        MATCH (c:Concept {graph_id: $metamodel_id, name: $name})
-        RETURN c
-        """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id, "name": name})
+        result = await self.db.execute_read(
+            GET_BY_NAME_QUERY, {"metamodel_id": metamodel_id, "name": name}
+        )
         if not result:
             return None
-        return self.model(**self._add_node_type(convert_neo4j_types(result[0]["c"])))
+        return self._from_row(result[0]["c"])
 
     async def update_position(self, concept_id: str, x: float, y: float) -> Concept | None:
         """
@@ -135,16 +213,12 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Updated concept or None
         """
-        query = """
-        MATCH (c:Concept {id: $id})
-        SET c.x = $x, c.y = $y
-        SET c.updated_at = datetime()
-        RETURN c
-        """
-        result = self.db.execute_query(query, {"id": concept_id, "x": x, "y": y})
+        result = await self.db.execute_write(
+            UPDATE_POSITION_QUERY, {"id": concept_id, "x": x, "y": y}
+        )
         if not result:
             return None
-        return self.model(**self._add_node_type(convert_neo4j_types(result[0]["c"])))
+        return self._from_row(result[0]["c"])
 
     async def get_with_attributes(self, concept_id: str) -> dict[str, Any] | None:
         """
@@ -156,21 +230,15 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Dict with concept and attributes list
         """
-        query = """
-        MATCH (c:Concept {id: $id})
-        OPTIONAL MATCH (c)<-[:ATTRIBUTE_OF]-(a:Attribute)
-        RETURN c, collect(a) as attributes
-        """
-        result = self.db.execute_query(query, {"id": concept_id})
+        result = await self.db.execute_read(GET_WITH_ATTRIBUTES_QUERY, {"id": concept_id})
         if not result:
             return None
 
-        concept_data = convert_neo4j_types(result[0]["c"])
-        attributes = [convert_neo4j_types(attr) for attr in result[0]["attributes"] if attr]
-
+        row = result[0]
         return {
-            "concept": self.model(**self._add_node_type(concept_data)),
-            "attributes": attributes,
+            "concept": self._from_row(row["c"]),
+            # collect() yields None for concepts without attributes (OPTIONAL MATCH)
+            "attributes": list(map(convert_neo4j_types, filter(None, row["attributes"]))),
         }
 
     async def count_by_metamodel(self, metamodel_id: str) -> int:
@@ -183,13 +251,34 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Number of concepts
         """
-        query = """
-        MATCH (c:Concept {metamodel_id: $metamodel_id})
-        RETURN count(c) as count
-        """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
+        result = await self.db.execute_read(
+            COUNT_BY_METAMODEL_QUERY, {"metamodel_id": metamodel_id}, parallel=True
+        )
         return result[0]["count"] if result else 0
 
+    async def list_with_total(
+        self, metamodel_id: str, skip: int = 0, limit: int = 100
+    ) -> tuple[list[Concept], int]:
+        """
+        Get a page of concepts and the total count in a single query
+
+        Args:
+            metamodel_id: Metamodel ID (graph_id)
+            skip: Number to skip
+            limit: Max results
+
+        Returns:
+            (concepts of the page, total number of concepts in the metamodel)
+        """
+        result = await self.db.execute_read(
+            LIST_WITH_TOTAL_QUERY,
+            {"metamodel_id": metamodel_id, "skip": skip, "limit": limit},
+            parallel=True,
+        )
+        if not result:
+            return [], 0
+        return self._from_rows(result[0]["items"]), result[0]["total"]
+
     async def delete_all_by_metamodel(self, metamodel_id: str) -> int:
         """
         Delete all concepts for a metamodel.
@@ -201,15 +290,11 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             Number of deleted concepts
         """
-        query = """
-        MATCH (c:Concept {graph_id: $metamodel_id})
-        WITH c, count(c) as node_count
-        DETACH DELETE c
-        RETURN node_count as deleted
-        """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
+        result = await self.db.execute_write(
+            DELETE_ALL_BY_METAMODEL_QUERY, {"metamodel_id": metamodel_id}
+        )
         deleted = result[0]["deleted"] if result else 0
-        logger.info(f"Deleted {deleted} concepts for metamodel {metamodel_id}")
+        logger.info("Deleted %d concepts for metamodel %s", deleted, metamodel_id)
         return deleted
 
     async def delete(self, entity_id: str) -> bool:
@@ -225,21 +310,15 @@ class ConceptRepository(BaseRepository[Concept]):
         Returns:
             True if deleted, False if not found
         """
-        query = f"""
-        MATCH (c:{self.label} {{id: $id}})
-        WITH c, count(c) as node_count
-        DETACH DELETE c
-        RETURN node_count as deleted
-        """
-        logger.info(f"🗑️ Attempting to delete {self.label} with id={entity_id}")
-        result = self.db.execute_query(query, {"id": entity_id})
-        logger.info(f"🔍 Delete query result: {result}")
+        logger.info("🗑️ Attempting to delete %s with id=%s", self.label, entity_id)
+        result = await self.db.execute_write(DELETE_QUERY, {"id": entity_id})
+        logger.debug("🔍 Delete query result: %s", result)
 
         deleted = result and len(result) > 0 and result[0]["deleted"] > 0
 
         if deleted:
-            logger.info(f"✅ Deleted {self.label} with id={entity_id} and all its relationships")
+            logger.info("✅ Deleted %s with id=%s and all its relationships", self.label, entity_id)
         else:
-            logger.warning(f"⚠️ {self.label} with id={entity_id} not found for deletion")
+            logger.warning("⚠️ %s with id=%s not found for deletion", self.label, entity_id)
 
         return deleted
@@ -3,14 +3,158 @@ MetamodelEdge Repository - Database operations for metamodel edges (DOMAIN, RANG
 """
 
 import logging
+from operator import itemgetter
 from typing import Any
 
-from src.models.MDE.M2 import MetamodelEdge, MetamodelEdgeType
+from src.models.MDE.M2 import MetamodelEdge, MetamodelEdgeRow, MetamodelEdgeType
 
 from ...base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Requêtes par type de relation, construites une seule fois : le type de relation
+# ne peut pas être paramétré, mais chaque texte reste identique d'un appel à l'autre
+_EDGE_MATCH = "MATCH (source {{id: $source_id}})-[edge:{rel}]->(target {{id: $target_id}})"
+_CHECK_EDGE_QUERIES = {
+    t: _EDGE_MATCH.format(rel=t.value.upper()) + " RETURN count(edge) as edge_count"
+    for t in MetamodelEdgeType
+}
+_UPDATE_EDGE_QUERIES = {
+    t: _EDGE_MATCH.format(rel=t.value.upper())
+    + " SET edge += $updates SET edge.updated_at = datetime() RETURN edge"
+    for t in MetamodelEdgeType
+}
+_DELETE_EDGE_QUERIES = {
+    t: _EDGE_MATCH.format(rel=t.value.upper()) + " DELETE edge RETURN count(edge) as deleted_count"
+    for t in MetamodelEdgeType
+}
+
+
+# Création : labels source/cible (+ SET éventuel) de chaque type d'edge.
+# {source_id}/{target_id} valent $source_id/$target_id (création unitaire)
+# ou row.source_id/row.target_id (UNWIND, une requête par type)
+_EDGE_ENDPOINTS = {
+    MetamodelEdgeType.DOMAIN: ("Relationship", "Concept", ""),
+    MetamodelEdgeType.RANGE: ("Relationship", "Concept", ""),
+    MetamodelEdgeType.HAS_ATTRIBUTE: (
+        "Concept",
+        "Attribute",
+        "SET target.concept_id = {source_id}\n",
+    ),
+    MetamodelEdgeType.SUBCLASS_OF: ("Concept", "Concept", ""),
+}
+_CREATE_EDGE_TEMPLATE = """
+MATCH (source:{source_label} {{id: {source_id}}})
+MATCH (target:{target_label} {{id: {target_id}}})
+MERGE (source)-[edge:{rel}]->(target)
+{set_clause}RETURN source.id as source_id, source.name as source_label,
+       target.id as target_id, target.name as target_label
+"""
+
+
+def _create_edge_query(edge_type: MetamodelEdgeType, source_id: str, target_id: str) -> str:
+    """Requête de création d'un type d'edge, avec les expressions d'id données"""
+    source_label, target_label, set_clause = _EDGE_ENDPOINTS[edge_type]
+    return _CREATE_EDGE_TEMPLATE.format(
+        source_label=source_label,
+        target_label=target_label,
+        source_id=source_id,
+        target_id=target_id,
+        rel=edge_type.value.upper(),
+        set_clause=set_clause.format(source_id=source_id),
+    )
+
+
+_CREATE_EDGE_QUERIES = {
+    t: _create_edge_query(t, "$source_id", "$target_id") for t in _EDGE_ENDPOINTS
+}
+_BULK_CREATE_EDGE_QUERIES = {
+    t: "UNWIND $rows AS row" + _create_edge_query(t, "row.source_id", "row.target_id")
+    for t in _EDGE_ENDPOINTS
+}
+
+
+# Lecture des edges d'un metamodel, une requête par type
+_EDGE_READ_QUERIES = {
+    MetamodelEdgeType.DOMAIN: """
+        MATCH (metamodel:Metamodel {id: $metamodel_id})
+        MATCH (metamodel)-[:HAS_RELATION]->(rel:Relationship)
+        MATCH (rel)-[edge:DOMAIN]->(concept:Concept)
+        RETURN
+            rel.id as source_id,
+            rel.name as source_label,
+            concept.id as target_id,
+            concept.name as target_label
+        """,
+    MetamodelEdgeType.RANGE: """
+        MATCH (metamodel:Metamodel {id: $metamodel_id})
+        MATCH (metamodel)-[:HAS_RELATION]->(rel:Relationship)
+        MATCH (rel)-[edge:RANGE]->(concept:Concept)
+        RETURN
+            rel.id as source_id,
+            rel.name as source_label,
+            concept.id as target_id,
+            concept.name as target_label
+        """,
+    MetamodelEdgeType.HAS_ATTRIBUTE: """
+        MATCH (metamodel:Metamodel {id: $metamodel_id})
+        MATCH (metamodel)-[:HAS_CONCEPT]->(concept:Concept)
+        MATCH (concept)-[edge:HAS_ATTRIBUTE]->(attr:Attribute)
+        RETURN
+            concept.id as source_id,
+            concept.name as source_label,
+            attr.id as target_id,
+            attr.name as target_label
+        """,
+    MetamodelEdgeType.SUBCLASS_OF: """
+        MATCH (metamodel:Metamodel {id: $metamodel_id})
+        MATCH (metamodel)-[:HAS_CONCEPT]->(child:Concept)
+        MATCH (child)-[edge:SUBCLASS_OF]->(parent:Concept)
+        RETURN
+            child.id as source_id,
+            child.name as source_label,
+            parent.id as target_id,
+            parent.name as target_label
+        """,
+}
+
+# Lecture de tous les edges d'un metamodel en un seul aller-retour : chaque branche
+# est marquée par son type (UNION ALL, sans DISTINCT)
+_ALL_EDGES_READ_QUERY = "        UNION ALL\n".join(
+    f"{query.rstrip()},\n            '{edge_type.value}' as edge_type\n"
+    for edge_type, query in _EDGE_READ_QUERIES.items()
+)
+
+# Description générée pour chaque type d'edge (f-strings : pas de parsing de template par record)
+_EDGE_DESCRIPTIONS = {
+    MetamodelEdgeType.DOMAIN: lambda source, target: f"Domain of {source}",
+    MetamodelEdgeType.RANGE: lambda source, target: f"Range of {source}",
+    MetamodelEdgeType.HAS_ATTRIBUTE: lambda source, target: f"{source} has {target}",
+    MetamodelEdgeType.SUBCLASS_OF: lambda source, target: f"{source} is a {target}",
+}
+
+# Préfixe des ids/noms générés, résolu une fois par type
+_EDGE_PREFIXES = {edge_type: f"{edge_type.value}-" for edge_type in MetamodelEdgeType}
+
+
+def _row_from_record(edge_type: MetamodelEdgeType, record) -> MetamodelEdgeRow:
+    """Construire un MetamodelEdgeRow depuis un record Neo4j"""
+    source_id = record["source_id"]
+    target_id = record["target_id"]
+    source_label = record["source_label"]
+    target_label = record["target_label"]
+    prefix = _EDGE_PREFIXES[edge_type]
+    return MetamodelEdgeRow(
+        id=f"{prefix}{source_id}-{target_id}",
+        name=f"{prefix}{source_label}-{target_label}",
+        edge_type=edge_type,
+        source_id=source_id,
+        target_id=target_id,
+        source_label=source_label,
+        target_label=target_label,
+        description=_EDGE_DESCRIPTIONS[edge_type](source_label, target_label),
+    )
+
 
 class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
     """Repository for metamodel edge CRUD operations"""
@@ -34,166 +178,67 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
         Returns:
             List[MetamodelEdge]: Liste de tous les edges du metamodel
         """
-        edges = []
+        rows = await self._fetch_all_rows(metamodel_id)
+        return [row.to_model(metamodel_id) for row in rows]
+
+    async def get_graph_rows(self, metamodel_id: str) -> list[MetamodelEdgeRow]:
+        """
+        Get all edges of a metamodel as lightweight rows (graph payload path)
 
-        # 1. Récupérer les edges DOMAIN (Relation → Concept source)
-        domain_edges = await self._get_domain_edges(metamodel_id)
-        edges.extend(domain_edges)
+        Same data as get_by_metamodel, without building validated models.
 
-        # 2. Récupérer les edges RANGE (Relation → Concept target)
-        range_edges = await self._get_range_edges(metamodel_id)
-        edges.extend(range_edges)
+        Args:
+            metamodel_id: ID du metamodel
 
-        # 3. Récupérer les edges HAS_ATTRIBUTE (Concept → Attribute)
-        attribute_edges = await self._get_has_attribute_edges(metamodel_id)
-        edges.extend(attribute_edges)
+        Returns:
+            List[MetamodelEdgeRow]: Liste de tous les edges du metamodel
+        """
+        return await self._fetch_all_rows(metamodel_id)
 
-        # 4. Récupérer les edges SUBCLASS_OF (Concept → Concept parent)
-        subclass_edges = await self._get_subclass_of_edges(metamodel_id)
-        edges.extend(subclass_edges)
+    async def _fetch_all_rows(self, metamodel_id: str) -> list[MetamodelEdgeRow]:
+        """Lire les edges de tous les types en une requête et construire les rows"""
+        result = await self.db.execute_read(
+            _ALL_EDGES_READ_QUERY, {"metamodel_id": metamodel_id}, parallel=True
+        )
+        rows = [
+            _row_from_record(MetamodelEdgeType.from_value(record["edge_type"]), record)
+            for record in result
+        ]
+        logger.info(f"Found {len(rows)} edges for metamodel {metamodel_id}")
+        return rows
+
+    async def _fetch_rows(
+        self, edge_type: MetamodelEdgeType, metamodel_id: str
+    ) -> list[MetamodelEdgeRow]:
+        """Exécuter la requête de lecture d'un type d'edge et construire les rows"""
+        result = await self.db.execute_read(
+            _EDGE_READ_QUERIES[edge_type], {"metamodel_id": metamodel_id}, parallel=True
+        )
+        rows = [_row_from_record(edge_type, record) for record in result]
+        logger.debug(f"Found {len(rows)} {edge_type.value.upper()} edges")
+        return rows
 
-        logger.info(f"Found {len(edges)} edges for metamodel {metamodel_id}")
-        return edges
+    async def _get_edges(
+        self, edge_type: MetamodelEdgeType, metamodel_id: str
+    ) -> list[MetamodelEdge]:
+        rows = await self._fetch_rows(edge_type, metamodel_id)
+        return [row.to_model(metamodel_id) for row in rows]
 
     async def _get_domain_edges(self, metamodel_id: str) -> list[MetamodelEdge]:
         """Récupérer les edges DOMAIN: (Relation)-[:DOMAIN]->(Concept)"""
-        query = """
-        MATCH (metamodel:Metamodel {id: $metamodel_id})
-        MATCH (metamodel)-[:HAS_RELATION]->(rel:Relationship)
-        MATCH (rel)-[edge:DOMAIN]->(concept:Concept)
-        RETURN 
-            rel.id as source_id,
-            rel.name as source_label,
-            concept.id as target_id,
-            concept.name as target_label,
-            'domain' as edge_type,
-            $metamodel_id as graph_id
-        """
-
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
-
-        edges = []
-        for record in result:
-            edge_data = {
-                "id": f"domain-{record['source_id']}-{record['target_id']}",
-                "name": f"domain-{record['source_label']}-{record['target_label']}",
-                "edge_type": MetamodelEdgeType.DOMAIN,
-                "source_id": record["source_id"],
-                "target_id": record["target_id"],
-                "source_label": record["source_label"],
-                "target_label": record["target_label"],
-                "graph_id": metamodel_id,
-                "description": f"Domain of {record['source_label']}",
-            }
-            edges.append(MetamodelEdge(**edge_data))
-
-        logger.debug(f"Found {len(edges)} DOMAIN edges")
-        return edges
+        return await self._get_edges(MetamodelEdgeType.DOMAIN, metamodel_id)
 
     async def _get_range_edges(self, metamodel_id: str) -> list[MetamodelEdge]:
         """Récupérer les edges RANGE: (Relation)-[:RANGE]->(Concept)"""
-        query = """
-        MATCH (metamodel:Metamodel {id: $metamodel_id})
-        MATCH (metamodel)-[:HAS_RELATION]->(rel:Relationship)
-        MATCH (rel)-[edge:RANGE]->(concept:Concept)
-        RETURN 
-            rel.id as source_id,
-            rel.name as source_label,
-            concept.id as target_id,
-            concept.name as target_label,
-            'range' as edge_type,
-            $metamodel_id as graph_id
-        """
-
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
-
-        edges = []
-        for record in result:
-            edge_data = {
-                "id": f"range-{record['source_id']}-{record['target_id']}",
-                "name": f"range-{record['source_label']}-{record['target_label']}",
-                "edge_type": MetamodelEdgeType.RANGE,
-                "source_id": record["source_id"],
-                "target_id": record["target_id"],
-                "source_label": record["source_label"],
-                "target_label": record["target_label"],
-                "graph_id": metamodel_id,
-                "description": f"Range of {record['source_label']}",
-            }
-            edges.append(MetamodelEdge(**edge_data))
-
-        logger.debug(f"Found {len(edges)} RANGE edges")
-        return edges
+        return await self._get_edges(MetamodelEdgeType.RANGE, metamodel_id)
 
     async def _get_has_attribute_edges(self, metamodel_id: str) -> list[MetamodelEdge]:
         """Récupérer les edges HAS_ATTRIBUTE: (Concept)-[:HAS_ATTRIBUTE]->(Attribute)"""
-        query = """
-        MATCH (metamodel:Metamodel {id: $metamodel_id})
-        MATCH (metamodel)-[:HAS_CONCEPT]->(concept:Concept)
-        MATCH (concept)-[edge:HAS_ATTRIBUTE]->(attr:Attribute)
-        RETURN 
-            concept.id as source_id,
-            concept.name as source_label,
-            attr.id as target_id,
-            attr.name as target_label,
-            'has_attribute' as edge_type,
-            $metamodel_id as graph_id
-        """
-
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
-
-        edges = []
-        for record in result:
-            edge_data = {
-                "id": f"has_attribute-{record['source_id']}-{record['target_id']}",
-                "name": f"has_attribute-{record['source_label']}-{record['target_label']}",
-                "edge_type": MetamodelEdgeType.HAS_ATTRIBUTE,
-                "source_id": record["source_id"],
-                "target_id": record["target_id"],
-                "source_label": record["source_label"],
-                "target_label": record["target_label"],
-                "graph_id": metamodel_id,
-                "description": f"{record['source_label']} has {record['target_label']}",
-            }
-            edges.append(MetamodelEdge(**edge_data))
-
-        logger.debug(f"Found {len(edges)} HAS_ATTRIBUTE edges")
-        return edges
+        return await self._get_edges(MetamodelEdgeType.HAS_ATTRIBUTE, metamodel_id)
 
     async def _get_subclass_of_edges(self, metamodel_id: str) -> list[MetamodelEdge]:
         """Récupérer les edges SUBCLASS_OF: (Concept)-[:SUBCLASS_OF]->(Concept parent)"""
-        query = """
-        MATCH (metamodel:Metamodel {id: $metamodel_id})
-        MATCH (metamodel)-[:HAS_CONCEPT]->(child:Concept)
-        MATCH (child)-[edge:SUBCLASS_OF]->(parent:Concept)
-        RETURN 
-            child.id as source_id,
-            child.name as source_label,
-            parent.id as target_id,
-            parent.name as target_label,
-            'subclass_of' as edge_type,
-            $metamodel_id as graph_id
-        """
-
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
-
-        edges = []
-        for record in result:
-            edge_data = {
-                "id": f"subclass_of-{record['source_id']}-{record['target_id']}",
-                "name": f"subclass_of-{record['source_label']}-{record['target_label']}",
-                "edge_type": MetamodelEdgeType.SUBCLASS_OF,
-                "source_id": record["source_id"],
-                "target_id": record["target_id"],
-                "source_label": record["source_label"],
-                "target_label": record["target_label"],
-                "graph_id": metamodel_id,
-                "description": f"{record['source_label']} is a {record['target_label']}",
-            }
-            edges.append(MetamodelEdge(**edge_data))
-
-        logger.debug(f"Found {len(edges)} SUBCLASS_OF edges")
-        return edges
+        return await self._get_edges(MetamodelEdgeType.SUBCLASS_OF, metamodel_id)
 
     async def get_by_type(
         self, metamodel_id: str, edge_type: MetamodelEdgeType
@@ -238,15 +283,10 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
         Raises:
             ValueError: Si l'edge existe déjà
         """
-        # Vérifier si l'edge existe déjà
-        edge_rel_type = edge_type.value.upper()
-        check_query = f"""
-        MATCH (source {{id: $source_id}})-[edge:{edge_rel_type}]->(target {{id: $target_id}})
-        RETURN count(edge) as edge_count
-        """
-
-        check_result = self.db.execute_query(
-            check_query, {"source_id": source_id, "target_id": target_id}
+        # Vérifier si l'edge existe déjà (lecture : pas de transaction d'écriture
+        # ni d'invalidation du cache)
+        check_result = await self.db.execute_read(
+            _CHECK_EDGE_QUERIES[edge_type], {"source_id": source_id, "target_id": target_id}
         )
 
         if check_result and check_result[0]["edge_count"] > 0:
@@ -254,48 +294,9 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
                 f"Un lien de type {edge_type.value} existe déjà entre {source_id} et {target_id}"
             )
 
-        # Déterminer les types de noeuds selon le type d'edge
-        if edge_type == MetamodelEdgeType.DOMAIN:
-            # DOMAIN: Relation → Concept
-            query = """
-            MATCH (rel:Relationship {id: $source_id})
-            MATCH (concept:Concept {id: $target_id})
-            MERGE (rel)-[edge:DOMAIN]->(concept)
-            RETURN rel.id as source_id, rel.name as source_label,
-                   concept.id as target_id, concept.name as target_label
-            """
-        elif edge_type == MetamodelEdgeType.RANGE:
-            # RANGE: Relation → Concept
-            query = """
-            MATCH (rel:Relationship {id: $source_id})
-            MATCH (concept:Concept {id: $target_id})
-            MERGE (rel)-[edge:RANGE]->(concept)
-            RETURN rel.id as source_id, rel.name as source_label,
-                   concept.id as target_id, concept.name as target_label
-            """
-        elif edge_type == MetamodelEdgeType.HAS_ATTRIBUTE:
-            # HAS_ATTRIBUTE: Concept → Attribute
-            query = """
-            MATCH (concept:Concept {id: $source_id})
-            MATCH (attr:Attribute {id: $target_id})
-            MERGE (concept)-[edge:HAS_ATTRIBUTE]->(attr)
-            SET attr.concept_id = $source_id
-            RETURN concept.id as source_id, concept.name as source_label,
-                   attr.id as target_id, attr.name as target_label
-            """
-        elif edge_type == MetamodelEdgeType.SUBCLASS_OF:
-            # SUBCLASS_OF: Concept → Concept
-            query = """
-            MATCH (child:Concept {id: $source_id})
-            MATCH (parent:Concept {id: $target_id})
-            MERGE (child)-[edge:SUBCLASS_OF]->(parent)
-            RETURN child.id as source_id, child.name as source_label,
-                   parent.id as target_id, parent.name as target_label
-            """
-        else:
-            raise ValueError(f"Unknown edge type: {edge_type}")
-
-        result = self.db.execute_query(query, {"source_id": source_id, "target_id": target_id})
+        result = await self.db.execute_write(
+            _CREATE_EDGE_QUERIES[edge_type], {"source_id": source_id, "target_id": target_id}
+        )
 
         if not result:
             raise ValueError(
@@ -319,6 +320,54 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
         logger.info(f"Created {edge_type.value} edge: {source_id} → {target_id}")
         return edge
 
+    async def create_edges_bulk(
+        self, metamodel_id: str, edges: list[dict[str, Any]]
+    ) -> list[MetamodelEdge]:
+        """
+        Create many edges with one UNWIND query per edge type
+
+        Contrairement à create_edge, un edge déjà présent n'est pas une erreur (MERGE),
+        et les edges dont un des noeuds n'existe pas sont ignorés.
+
+        Args:
+            metamodel_id: ID du metamodel
+            edges: Dicts with source_id, target_id and edge_type (MetamodelEdgeType)
+
+        Returns:
+            List[MetamodelEdge]: Les edges créés
+        """
+        rows_by_type: dict[MetamodelEdgeType, list[dict[str, str]]] = {}
+        for edge in edges:
+            rows_by_type.setdefault(edge["edge_type"], []).append(
+                {"source_id": edge["source_id"], "target_id": edge["target_id"]}
+            )
+
+        created = []
+        for edge_type, rows in rows_by_type.items():
+            # Verrous pris dans le même ordre par des chargements concurrents : moins de deadlocks
+            rows.sort(key=itemgetter("source_id"))
+            result = await self.db.execute_write(
+                _BULK_CREATE_EDGE_QUERIES[edge_type], {"rows": rows}
+            )
+            prefix = _EDGE_PREFIXES[edge_type]
+            created.extend(
+                MetamodelEdge(
+                    id=f"{prefix}{record['source_id']}-{record['target_id']}",
+                    name=f"{prefix}{record['source_label']}-{record['target_label']}",
+                    edge_type=edge_type,
+                    source_id=record["source_id"],
+                    target_id=record["target_id"],
+                    source_label=record["source_label"],
+                    target_label=record["target_label"],
+                    graph_id=metamodel_id,
+                    description=f"{edge_type.value} edge",
+                )
+                for record in result
+            )
+
+        logger.info(f"Created {len(created)} edges in {len(rows_by_type)} batches")
+        return created
+
     async def update_edge(
         self, source_id: str, target_id: str, edge_type: MetamodelEdgeType, updates: dict[str, Any]
     ) -> MetamodelEdge | None:
@@ -334,25 +383,15 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
         Returns:
             Updated MetamodelEdge or None if not found
         """
-        rel_type = edge_type.value.upper()
-
-        set_clauses = ", ".join(
-            f"edge.{k} = ${k}" for k in updates if k not in ("source_id", "target_id", "edge_type")
-        )
-        if not set_clauses:
+        edge_updates = {
+            k: v for k, v in updates.items() if k not in ("source_id", "target_id", "edge_type")
+        }
+        if not edge_updates:
             # Just return existing edge
             return None
 
-        params = {"source_id": source_id, "target_id": target_id, **updates}
-
-        query = f"""
-        MATCH (source {{id: $source_id}})-[edge:{rel_type}]->(target {{id: $target_id}})
-        SET {set_clauses}
-        SET edge.updated_at = datetime()
-        RETURN edge
-        """
-
-        result = self.db.execute_query(query, params)
+        params = {"source_id": source_id, "target_id": target_id, "updates": edge_updates}
+        result = await self.db.execute_write(_UPDATE_EDGE_QUERIES[edge_type], params)
 
         if not result:
             logger.warning(
@@ -387,16 +426,9 @@ class MetamodelEdgeRepository(BaseRepository[MetamodelEdge]):
         Returns:
             bool: True si l'edge a été supprimé
         """
-        # Construire le nom de la relation Neo4j
-        rel_type = edge_type.value.upper().replace("_", "_")
-
-        query = f"""
-        MATCH (source {{id: $source_id}})-[edge:{rel_type}]->(target {{id: $target_id}})
-        DELETE edge
-        RETURN count(edge) as deleted_count
-        """
-
-        result = self.db.execute_query(query, {"source_id": source_id, "target_id": target_id})
+        result = await self.db.execute_write(
+            _DELETE_EDGE_QUERIES[edge_type], {"source_id": source_id, "target_id": target_id}
+        )
 
         deleted = result[0]["deleted_count"] > 0 if result else False
 
@@ -60,7 +60,7 @@ class MetamodelRepository(BaseRepository[Metamodel]):
             """
             params = {"props": prepared_data}
 
-        result = self.db.execute_query(query, params)
+        result = await self.db.execute_write(query, params)
 
         if not result:
             raise ValueError(f"Failed to create {self.label}")
@@ -78,7 +78,7 @@ class MetamodelRepository(BaseRepository[Metamodel]):
         RETURN m
         """
 
-        result = self.db.execute_query(query, {"name": name})
+        result = await self.db.execute_read(query, {"name": name})
         logger.info(f"🔍 Result from Neo4j: {result}")
 
         if not result or len(result) == 0:
@@ -99,7 +99,8 @@ class MetamodelRepository(BaseRepository[Metamodel]):
         ORDER BY m.created_at DESC
         """
 
-        result = self.db.execute_query(query, {"status": status})
+        # Listes par statut relues en boucle par le front : servies par le cache
+        result = await self.db.execute_read(query, {"status": status}, cached=True)
 
         if not result:
             return []
@@ -116,7 +117,7 @@ class MetamodelRepository(BaseRepository[Metamodel]):
         ORDER BY m.created_at DESC
         """
 
-        result = self.db.execute_query(query, {"author": author})
+        result = await self.db.execute_read(query, {"author": author})
 
         if not result:
             return []
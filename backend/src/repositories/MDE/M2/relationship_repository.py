@@ -83,7 +83,9 @@ class RelationshipRepository(BaseRepository[Relationship]):
         CREATE (metamodel)-[:HAS_RELATION]->(r)
         RETURN r
         """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id, "props": rel_data})
+        result = await self.db.execute_write(
+            query, {"metamodel_id": metamodel_id, "props": rel_data}
+        )
         if not result:
             raise ValueError("Failed to create Relationship")
 
@@ -138,7 +140,7 @@ class RelationshipRepository(BaseRepository[Relationship]):
         CREATE (r)-[:RANGE]->(target)
         RETURN r
         """
-        result = self.db.execute_query(
+        result = await self.db.execute_write(
             query,
             {
                 "metamodel_id": metamodel_id,
@@ -180,11 +182,11 @@ class RelationshipRepository(BaseRepository[Relationship]):
         SKIP $skip
         LIMIT $limit
         """
-        result = self.db.execute_query(
+        result = await self.db.execute_read(
             query, {"metamodel_id": metamodel_id, "skip": skip, "limit": limit}
         )
 
-        relationships = []
+        rows = []
         for row in result:
             rel_data = convert_neo4j_types(row["r"])
             # Add source and target info from the graph edges
@@ -194,9 +196,9 @@ class RelationshipRepository(BaseRepository[Relationship]):
             rel_data["target_label"] = row["target_name"]
             rel_data["graph_id"] = metamodel_id
 
-            relationships.append(self.model(**self._normalize_relationship_data(rel_data)))
+            rows.append(self._normalize_relationship_data(rel_data))
 
-        return relationships
+        return self._build_many(rows)
 
     async def get_by_type(
         self, metamodel_id: str, relationship_type: RelationshipType
@@ -219,11 +221,11 @@ class RelationshipRepository(BaseRepository[Relationship]):
                target.id as target_id, target.name as target_name
         ORDER BY r.created_at ASC
         """
-        result = self.db.execute_query(
+        result = await self.db.execute_read(
             query, {"metamodel_id": metamodel_id, "type": relationship_type.value}
         )
 
-        relationships = []
+        rows = []
         for row in result:
             rel_data = convert_neo4j_types(row["r"])
             rel_data["source_id"] = row["source_id"]
@@ -231,9 +233,9 @@ class RelationshipRepository(BaseRepository[Relationship]):
             rel_data["target_id"] = row["target_id"]
             rel_data["target_label"] = row["target_name"]
             rel_data["graph_id"] = metamodel_id
-            relationships.append(self.model(**self._normalize_relationship_data(rel_data)))
+            rows.append(self._normalize_relationship_data(rel_data))
 
-        return relationships
+        return self._build_many(rows)
 
     async def get_between_concepts(self, source_id: str, target_id: str) -> Relationship | None:
         """
@@ -252,7 +254,7 @@ class RelationshipRepository(BaseRepository[Relationship]):
         RETURN r, source.id as source_id, source.name as source_name,
                target.id as target_id, target.name as target_name
         """
-        result = self.db.execute_query(query, {"source_id": source_id, "target_id": target_id})
+        result = await self.db.execute_read(query, {"source_id": source_id, "target_id": target_id})
         if not result:
             return None
 
@@ -272,16 +274,16 @@ class RelationshipRepository(BaseRepository[Relationship]):
         RETURN r, target.id as target_id, target.name as target_name
         ORDER BY r.created_at DESC
         """
-        result = self.db.execute_query(query, {"concept_id": concept_id})
-        rels = []
+        result = await self.db.execute_read(query, {"concept_id": concept_id})
+        rows = []
         for row in result:
             data = convert_neo4j_types(row["r"])
             data["source_id"] = concept_id
             data["target_id"] = row["target_id"]
             data["source_label"] = data.get("name")
             data["target_label"] = row["target_name"]
-            rels.append(self.model(**self._normalize_relationship_data(data)))
-        return rels
+            rows.append(self._normalize_relationship_data(data))
+        return self._build_many(rows)
 
     async def get_by_target_concept(self, concept_id: str) -> list[Relationship]:
         """Get relationships where this concept is the target (RANGE)"""
@@ -291,16 +293,16 @@ class RelationshipRepository(BaseRepository[Relationship]):
         RETURN r, source.id as source_id, source.name as source_name
         ORDER BY r.created_at DESC
         """
-        result = self.db.execute_query(query, {"concept_id": concept_id})
-        rels = []
+        result = await self.db.execute_read(query, {"concept_id": concept_id})
+        rows = []
         for row in result:
             data = convert_neo4j_types(row["r"])
             data["source_id"] = row["source_id"]
             data["target_id"] = concept_id
             data["source_label"] = row["source_name"]
             data["target_label"] = data.get("name")
-            rels.append(self.model(**self._normalize_relationship_data(data)))
-        return rels
+            rows.append(self._normalize_relationship_data(data))
+        return self._build_many(rows)
 
     async def count_by_metamodel(self, metamodel_id: str) -> int:
         """
@@ -316,7 +318,7 @@ class RelationshipRepository(BaseRepository[Relationship]):
         MATCH (m:Metamodel {id: $metamodel_id})-[:HAS_RELATION]->(r:Relationship)
         RETURN count(r) as count
         """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
+        result = await self.db.execute_read(query, {"metamodel_id": metamodel_id})
         return result[0]["count"] if result else 0
 
     async def delete_all_by_metamodel(self, metamodel_id: str) -> int:
@@ -327,7 +329,7 @@ class RelationshipRepository(BaseRepository[Relationship]):
         DETACH DELETE r
         RETURN node_count as deleted
         """
-        result = self.db.execute_query(query, {"metamodel_id": metamodel_id})
+        result = await self.db.execute_write(query, {"metamodel_id": metamodel_id})
         deleted = result[0]["deleted"] if result else 0
         logger.info(f"Deleted {deleted} relationships for metamodel {metamodel_id}")
         return deleted
@@ -351,7 +353,7 @@ class RelationshipRepository(BaseRepository[Relationship]):
         DELETE has, domain, range, r
         RETURN node_count as deleted
         """
-        result = self.db.execute_query(query, {"id": entity_id})
+        result = await self.db.execute_write(query, {"id": entity_id})
         deleted = result and len(result) > 0 and result[0]["deleted"] > 0
 
         if deleted:
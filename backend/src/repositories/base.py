@@ -5,16 +5,22 @@ Base repository with generic CRUD operations
 import json
 import logging
 from abc import ABC
+from collections.abc import Iterable
 from datetime import datetime
+from functools import cache
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
+# Types stockés tels quels (test exact de type, avant isinstance)
+_NEO4J_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+
+
 def prepare_neo4j_properties(data: dict[str, Any]) -> dict[str, Any]:
     """
     Prepare data for Neo4j by converting complex types to JSON strings
@@ -34,9 +40,8 @@ def prepare_neo4j_properties(data: dict[str, Any]) -> dict[str, Any]:
     """
     prepared: dict[str, Any] = {}
     for key, value in data.items():
-        if value is None:
-            prepared[key] = None
-        elif isinstance(value, (str, int, float, bool)):
+        # Test exact de type d'abord ; isinstance seulement pour les sous-classes (enums)
+        if type(value) in _NEO4J_PRIMITIVES or isinstance(value, (str, int, float, bool)):
             prepared[key] = value
         elif isinstance(value, list):
             if all(isinstance(item, (str, int, float, bool)) for item in value):
@@ -104,6 +109,19 @@ def convert_neo4j_types(node: dict[str, Any]) -> dict[str, Any]:
     return converted
 
 
+@cache
+def _list_adapter(model: type) -> TypeAdapter | None:
+    """
+    TypeAdapter(list[model]) compiled once per model class
+
+    None for models with their own __init__ (e.g. Metamodel): the adapter does not
+    call __init__, so those are still built one by one.
+    """
+    if getattr(model, "__init__", None) is not BaseModel.__init__:
+        return None
+    return TypeAdapter(list[model])
+
+
 class BaseRepository(ABC, Generic[T]):
     """
     Generic repository pattern for Neo4j
@@ -124,6 +142,25 @@ class BaseRepository(ABC, Generic[T]):
         self.model = model
         self.label = label
 
+    def _prepare_row(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Hook: add fields that are not stored in Neo4j (e.g. node_type)"""
+        return data
+
+    def _from_row(self, node: dict[str, Any]) -> T:
+        """Build the model from a Neo4j node"""
+        return self.model(**self._prepare_row(convert_neo4j_types(node)))
+
+    def _from_rows(self, nodes: Iterable[dict[str, Any]]) -> list[T]:
+        """Build the models for a list of Neo4j nodes (see _build_many)"""
+        return self._build_many([self._prepare_row(convert_neo4j_types(node)) for node in nodes])
+
+    def _build_many(self, rows: list[dict[str, Any]]) -> list[T]:
+        """Build models from prepared dicts: one validation call for the whole list"""
+        adapter = _list_adapter(self.model)
+        if adapter is None:
+            return [self.model(**data) for data in rows]
+        return adapter.validate_python(rows)
+
     async def create(self, data: dict[str, Any]) -> T:
         """
         Create a new entity
@@ -147,13 +184,13 @@ class BaseRepository(ABC, Generic[T]):
         SET n.created_at = datetime()
         RETURN n
         """
-        result = self.db.execute_query(query, {"props": prepared_data})
+        result = await self.db.execute_write(query, {"props": prepared_data})
         if not result:
             raise ValueError(f"Failed to create {self.label}")
 
-        node = convert_neo4j_types(result[0]["n"])
+        node = result[0]["n"]
         logger.info(f"Created {self.label} with id={node.get('id')}")
-        return self.model(**node)
+        return self._from_row(node)
 
     async def get_by_id(self, entity_id: str) -> T | None:
         """
@@ -169,10 +206,10 @@ class BaseRepository(ABC, Generic[T]):
         MATCH (n:{self.label} {{id: $id}})
         RETURN n
         """
-        result = self.db.execute_query(query, {"id": entity_id})
+        result = await self.db.execute_read(query, {"id": entity_id})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         """
@@ -192,8 +229,8 @@ class BaseRepository(ABC, Generic[T]):
         SKIP $skip
         LIMIT $limit
         """
-        result = self.db.execute_query(query, {"skip": skip, "limit": limit})
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        result = await self.db.execute_read(query, {"skip": skip, "limit": limit})
+        return self._from_rows(row["n"] for row in result)
 
     async def update(self, entity_id: str, updates: dict[str, Any]) -> T | None:
         """
@@ -219,7 +256,7 @@ class BaseRepository(ABC, Generic[T]):
         RETURN n
         """
         logger.info(f"🔍 Executing update query for {self.label} id={entity_id}, updates={updates}")
-        result = self.db.execute_query(query, {"id": entity_id, "updates": updates})
+        result = await self.db.execute_write(query, {"id": entity_id, "updates": updates})
         logger.info(f"🔍 Update query result: {result}")
 
         if not result:
@@ -227,7 +264,7 @@ class BaseRepository(ABC, Generic[T]):
             return None
 
         logger.info(f"Updated {self.label} with id={entity_id}")
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def delete(self, entity_id: str) -> bool:
         """
@@ -246,7 +283,7 @@ class BaseRepository(ABC, Generic[T]):
         RETURN node_count as deleted
         """
         logger.info(f"🗑️ Attempting to delete {self.label} with id={entity_id}")
-        result = self.db.execute_query(query, {"id": entity_id})
+        result = await self.db.execute_write(query, {"id": entity_id})
         logger.info(f"🔍 Delete query result: {result}")
 
         deleted = result and len(result) > 0 and result[0]["deleted"] > 0
@@ -272,7 +309,7 @@ class BaseRepository(ABC, Generic[T]):
         MATCH (n:{self.label} {{id: $id}})
         RETURN count(n) > 0 as exists
         """
-        result = await self.db.execute_query(query, {"id": entity_id})
+        result = await self.db.execute_read(query, {"id": entity_id})
         return result[0]["exists"]
 
     async def count(self) -> int:
@@ -286,5 +323,5 @@ class BaseRepository(ABC, Generic[T]):
         MATCH (n:{self.label})
         RETURN count(n) as count
         """
-        result = await self.db.execute_query(query)
+        result = await self.db.execute_read(query)
         return result[0]["count"]
@@ -5,10 +5,14 @@ User repository - Data access layer for users
 import logging
 
 from ...models.oauth.user import User
-from ..base import BaseRepository, convert_neo4j_types
+from ..base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Requêtes constantes : le texte Cypher identique réutilise le plan en cache côté Neo4j
+GET_BY_USERNAME_QUERY = "MATCH (n:User {username: $username}) RETURN n"
+GET_BY_GITHUB_ID_QUERY = "MATCH (n:User {github_id: $github_id}) RETURN n"
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User entities"""
@@ -26,14 +30,10 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User or None if not found
         """
-        query = """
-        MATCH (n:User {username: $username})
-        RETURN n
-        """
-        result = self.db.execute_query(query, {"username": username})
+        result = await self.db.execute_read(GET_BY_USERNAME_QUERY, {"username": username})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_by_github_id(self, github_id: int) -> User | None:
         """
@@ -45,14 +45,10 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User or None if not found
         """
-        query = """
-        MATCH (n:User {github_id: $github_id})
-        RETURN n
-        """
-        result = self.db.execute_query(query, {"github_id": github_id})
+        result = await self.db.execute_read(GET_BY_GITHUB_ID_QUERY, {"github_id": github_id})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def update_github_token(self, user_id: str, github_token: str) -> User | None:
         """
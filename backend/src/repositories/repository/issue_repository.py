@@ -5,10 +5,25 @@ Issue repository - Data access layer for GitHub issues
 import logging
 
 from ...models.repository.issue import Issue
-from ..base import BaseRepository, convert_neo4j_types
+from ..base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Filtres optionnels exprimés en Cypher : un seul texte de requête, un seul plan
+GET_BY_REPOSITORY_QUERY = """
+MATCH (n:Issue)
+WHERE n.repository_id = $repository_id AND ($status IS NULL OR n.status = $status)
+RETURN n
+ORDER BY n.created_at DESC
+"""
+GET_COPILOT_ISSUES_QUERY = """
+MATCH (n:Issue)
+WHERE n.assigned_to_copilot = true
+  AND ($repository_id IS NULL OR n.repository_id = $repository_id)
+RETURN n
+ORDER BY n.copilot_started_at DESC
+"""
+
 
 class IssueRepository(BaseRepository[Issue]):
     """Repository for Issue entities"""
@@ -27,22 +42,9 @@ class IssueRepository(BaseRepository[Issue]):
         Returns:
             List of issues
         """
-        where_clause = "WHERE n.repository_id = $repository_id"
-        params = {"repository_id": repository_id}
-
-        if status:
-            where_clause += " AND n.status = $status"
-            params["status"] = status
-
-        query = f"""
-        MATCH (n:Issue)
-        {where_clause}
-        RETURN n
-        ORDER BY n.created_at DESC
-        """
-
-        result = self.db.execute_query(query, params)
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        params = {"repository_id": repository_id, "status": status or None}
+        result = await self.db.execute_read(GET_BY_REPOSITORY_QUERY, params)
+        return self._from_rows(row["n"] for row in result)
 
     async def get_by_github_id(self, github_id: int) -> Issue | None:
         """
@@ -58,10 +60,10 @@ class IssueRepository(BaseRepository[Issue]):
         MATCH (n:Issue {github_id: $github_id})
         RETURN n
         """
-        result = self.db.execute_query(query, {"github_id": github_id})
+        result = await self.db.execute_read(query, {"github_id": github_id})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_by_github_issue_number(
         self, repository_id: str, issue_number: int
@@ -80,12 +82,12 @@ class IssueRepository(BaseRepository[Issue]):
         MATCH (n:Issue {repository_id: $repository_id, github_issue_number: $issue_number})
         RETURN n
         """
-        result = self.db.execute_query(
+        result = await self.db.execute_read(
             query, {"repository_id": repository_id, "issue_number": issue_number}
         )
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def link_to_github(self, issue_id: str, github_data: dict) -> Issue | None:
         """
@@ -137,19 +139,6 @@ class IssueRepository(BaseRepository[Issue]):
         Returns:
             List of issues assigned to Copilot
         """
-        where_clause = "WHERE n.assigned_to_copilot = true"
-        params = {}
-
-        if repository_id:
-            where_clause += " AND n.repository_id = $repository_id"
-            params["repository_id"] = repository_id
-
-        query = f"""
-        MATCH (n:Issue)
-        {where_clause}
-        RETURN n
-        ORDER BY n.copilot_started_at DESC
-        """
-
-        result = self.db.execute_query(query, params)
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        params = {"repository_id": repository_id or None}
+        result = await self.db.execute_read(GET_COPILOT_ISSUES_QUERY, params)
+        return self._from_rows(row["n"] for row in result)
@@ -5,7 +5,7 @@ Message repository - Data access layer for PR comments
 import logging
 
 from ...models.repository.message import Message
-from ..base import BaseRepository, convert_neo4j_types
+from ..base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +31,8 @@ class MessageRepository(BaseRepository[Message]):
         RETURN n
         ORDER BY n.created_at ASC
         """
-        result = self.db.execute_query(query, {"issue_id": issue_id})
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        result = await self.db.execute_read(query, {"issue_id": issue_id})
+        return self._from_rows(row["n"] for row in result)
 
     async def get_by_github_comment_id(self, github_comment_id: int) -> Message | None:
         """
@@ -48,10 +48,10 @@ class MessageRepository(BaseRepository[Message]):
         MATCH (n:Message {github_comment_id: $github_comment_id})
         RETURN n
         """
-        result = self.db.execute_query(query, {"github_comment_id": github_comment_id})
+        result = await self.db.execute_read(query, {"github_comment_id": github_comment_id})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_copilot_messages(self, issue_id: str) -> list[Message]:
         """
@@ -68,5 +68,5 @@ class MessageRepository(BaseRepository[Message]):
         RETURN n
         ORDER BY n.created_at ASC
         """
-        result = self.db.execute_query(query, {"issue_id": issue_id})
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        result = await self.db.execute_read(query, {"issue_id": issue_id})
+        return self._from_rows(row["n"] for row in result)
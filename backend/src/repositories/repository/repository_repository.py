@@ -5,7 +5,7 @@ Repository repository - Data access layer for GitHub repositories
 import logging
 
 from ...models.repository import Repository
-from ..base import BaseRepository, convert_neo4j_types
+from ..base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +30,10 @@ class RepositoryRepository(BaseRepository[Repository]):
         MATCH (n:Repository {github_id: $github_id})
         RETURN n
         """
-        result = self.db.execute_query(query, {"github_id": github_id})
+        result = await self.db.execute_read(query, {"github_id": github_id})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_by_full_name(self, full_name: str) -> Repository | None:
         """
@@ -49,10 +49,10 @@ class RepositoryRepository(BaseRepository[Repository]):
         MATCH (n:Repository {full_name: $full_name})
         RETURN n
         """
-        result = self.db.execute_query(query, {"full_name": full_name})
+        result = await self.db.execute_read(query, {"full_name": full_name})
         if not result:
             return None
-        return self.model(**convert_neo4j_types(result[0]["n"]))
+        return self._from_row(result[0]["n"])
 
     async def get_by_owner(self, owner_username: str) -> list[Repository]:
         """
@@ -69,5 +69,5 @@ class RepositoryRepository(BaseRepository[Repository]):
         RETURN n
         ORDER BY n.github_pushed_at DESC
         """
-        result = self.db.execute_query(query, {"owner_username": owner_username})
-        return [self.model(**convert_neo4j_types(row["n"])) for row in result]
+        result = await self.db.execute_read(query, {"owner_username": owner_username})
+        return self._from_rows(row["n"] for row in result)
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from typing import Any
 
-from src.models.MDE.M2 import Metamodel
+from src.models.MDE.M2 import Metamodel, MetamodelStatus
 
 from ....repositories.MDE.M2.attribute_repository import AttributeRepository
 from ....repositories.MDE.M2.concept_repository import ConceptRepository
@@ -13,6 +14,11 @@ from ...base_service import BaseService
 logger = logging.getLogger(__name__)
 
 
+async def _no_rows() -> list:
+    """Résultat vide pour un repository non fourni"""
+    return []
+
+
 class MetamodelService(BaseService[Metamodel]):
     def __init__(
         self,
@@ -85,7 +91,7 @@ class MetamodelService(BaseService[Metamodel]):
     async def validate_metamodel(self, metamodel_id: str) -> Metamodel:
         """Change metamodel status to validated"""
         logger.info(f"✅ Service: Validating metamodel: {metamodel_id}")
-        return await self.update(metamodel_id, {"status": "validated"})
+        return await self.update(metamodel_id, {"status": MetamodelStatus.VALIDATED.value})
 
     async def deprecate_metamodel(self, metamodel_id: str) -> Metamodel:
         """Change metamodel status to deprecated"""
@@ -117,21 +123,34 @@ class MetamodelService(BaseService[Metamodel]):
         nodes = []
         edges = []
 
-        # Récupérer les Concepts
+        # Lectures indépendantes : lancées en parallèle (une transaction de lecture chacune)
+        concepts, attributes, relationships, metamodel_edges = await asyncio.gather(
+            self.concept_repository.get_by_metamodel(metamodel_id)
+            if self.concept_repository
+            else _no_rows(),
+            self.attribute_repository.get_by_metamodel(metamodel_id)
+            if self.attribute_repository
+            else _no_rows(),
+            self.relationship_repository.get_by_metamodel(metamodel_id)
+            if self.relationship_repository
+            else _no_rows(),
+            self.edge_repository.get_graph_rows(metamodel_id)
+            if self.edge_repository
+            else _no_rows(),
+        )
+
+        # Concepts
         if self.concept_repository:
-            concepts = await self.concept_repository.get_by_metamodel(metamodel_id)
             nodes.extend([c.to_graph_dict() for c in concepts])
             logger.info(f"  ✓ Found {len(concepts)} concepts")
 
-        # Récupérer TOUS les Attributs (standalone ET attachés à des concepts)
+        # TOUS les Attributs (standalone ET attachés à des concepts)
         if self.attribute_repository:
-            attributes = await self.attribute_repository.get_by_metamodel(metamodel_id)
             nodes.extend([a.to_graph_dict() for a in attributes])
             logger.info(f"  ✓ Found {len(attributes)} attributes (standalone and attached)")
 
-        # Récupérer les Relations
+        # Relations
         if self.relationship_repository:
-            relationships = await self.relationship_repository.get_by_metamodel(metamodel_id)
             nodes.extend([r.to_graph_dict() for r in relationships])
             logger.info(f"  ✓ Found {len(relationships)} relationships")
 
@@ -139,10 +158,8 @@ class MetamodelService(BaseService[Metamodel]):
         node_ids = {node["id"] for node in nodes}
         logger.info(f"  📋 Total node IDs: {len(node_ids)}")
 
-        # Récupérer les Edges
+        # Edges
         if self.edge_repository:
-            metamodel_edges = await self.edge_repository.get_by_metamodel(metamodel_id)
-
             # Filtrer les edges orphelins (qui pointent vers des nœuds inexistants)
             valid_edges = []
             orphaned_edges = []
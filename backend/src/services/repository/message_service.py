@@ -54,7 +54,8 @@ class MessageService(GitHubSyncService[Message]):
             "id": f"message-{github_data['id']}",
             "github_comment_id": github_data["id"],
             "github_comment_url": github_data["html_url"],
-            "content": github_data["body"],
+            # GitHub renvoie body=null pour un commentaire vide
+            "content": github_data["body"] or "",
             "author_username": github_data["user"]["login"],
             "author_type": "user",  # GitHub comments are from users
         }
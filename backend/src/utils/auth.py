@@ -46,6 +46,11 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return encoded_jwt
 
 
+def create_user_token(user) -> str:
+    """Crée le token JWT d'un utilisateur authentifié"""
+    return create_access_token(data={"sub": user.username, "user_id": user.id})
+
+
 def decode_access_token(token: str) -> dict | None:
     """Décode un token JWT"""
     try:
@@ -0,0 +1,50 @@
+"""
+Réponses JSON sérialisées avec orjson
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Types inconnus d'orjson : modèles Pydantic (même rendu que FastAPI)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _default_exclude_none(obj: Any) -> Any:
+    """Comme _default, sans les champs à None (response_model_exclude_none)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return _default(obj)
+
+
+def serialize_graph_dict(obj: Any, option: int = 0) -> bytes:
+    """
+    Encoder une sortie de to_graph_dict (ou une liste) en JSON
+
+    Les datetimes sont laissés tels quels par to_graph_dict : orjson les écrit
+    en ISO 8601 côté C, avec le même rendu que datetime.isoformat().
+    option : options orjson (ex. orjson.OPT_INDENT_2 pour les fichiers IR)
+    """
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def orjson_response(content: Any, status_code: int = 200, exclude_none: bool = False) -> Response:
+    """
+    Sérialiser une fois avec orjson et court-circuiter response_model
+
+    Les routes gardent response_model pour le schéma OpenAPI ; le contenu
+    retourné ici n'est ni revalidé ni repassé dans jsonable_encoder.
+    exclude_none omet les champs à None des modèles Pydantic.
+    """
+    default = _default_exclude_none if exclude_none else _default
+    return Response(
+        content=orjson.dumps(content, default=default),
+        status_code=status_code,
+        media_type="application/json",
+    )
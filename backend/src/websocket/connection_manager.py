@@ -2,9 +2,12 @@
 WebSocket Connection Manager for real-time issue processing updates.
 """
 
-import json
+import asyncio
 import logging
+from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -70,34 +73,39 @@ class ConnectionManager:
             issue_id: The issue ID
             message: Message dictionary to send (will be JSON serialized)
         """
-        message_str = json.dumps(message)
-
-        # Send to issue-specific connections
-        if issue_id in self.active_connections:
-            connections_to_remove = []
-            for connection in self.active_connections[issue_id]:
-                try:
-                    await connection.send_text(message_str)
-                except Exception as e:
-                    logger.error(f"Error sending message to WebSocket: {e}")
-                    connections_to_remove.append(connection)
-
-            # Clean up dead connections
-            for connection in connections_to_remove:
-                self.active_connections[issue_id].discard(connection)
-
-        # Send to global connections
-        global_to_remove = []
-        for connection in self.global_connections:
-            try:
-                await connection.send_text(message_str)
-            except Exception as e:
-                logger.error(f"Error sending message to global WebSocket: {e}")
-                global_to_remove.append(connection)
-
-        # Clean up dead global connections
-        for connection in global_to_remove:
-            self.global_connections.discard(connection)
+        # Encodé une seule fois, le même buffer est envoyé à tous les clients
+        await self.broadcast_encoded(issue_id, orjson.dumps(message).decode())
+
+    async def broadcast_encoded(self, issue_id: str, message_str: str):
+        """
+        Broadcast an already serialized JSON message.
+
+        Args:
+            issue_id: The issue ID
+            message_str: JSON payload, encoded once by the caller
+        """
+        targets = [*self.active_connections.get(issue_id, ()), *self.global_connections]
+        if not targets:
+            return
+
+        # Envois en parallèle : un client lent ne bloque plus les autres
+        results = await asyncio.gather(
+            *(connection.send_text(message_str) for connection in targets),
+            return_exceptions=True,
+        )
+
+        # Clean up dead connections
+        for connection, result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to WebSocket: {result}")
+                self._discard(connection, issue_id)
+
+    def _discard(self, websocket: WebSocket, issue_id: str):
+        """Remove a dead connection from the issue and global subscriptions."""
+        subscribers = self.active_connections.get(issue_id)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+        self.global_connections.discard(websocket)
 
     async def send_status_update(
         self,
@@ -121,22 +129,23 @@ class ConnectionManager:
             error: Error message if status is FAILED
             data: Additional data to include
         """
-        update = {
+        # orjson encodes datetimes, ints and nested dicts natively
+        update: dict[str, Any] = {
             "type": "status_update",
             "ticket_id": ticket_id,
             "status": status,
             "message": message,
-            "timestamp": None,  # Will be set by JSON encoder
+            "timestamp": datetime.now(UTC),
         }
 
         if step:
-            update["step"] = step  # type: ignore[assignment]
+            update["step"] = step
         if progress is not None:
-            update["progress"] = str(progress)
+            update["progress"] = progress
         if error:
-            update["error"] = error  # type: ignore[assignment]
+            update["error"] = error
         if data:
-            update["data"] = str(data)
+            update["data"] = data
 
         await self.broadcast_to_issue(ticket_id, update)
 
@@ -154,7 +163,7 @@ class ConnectionManager:
             "ticket_id": ticket_id,
             "level": log_level,
             "message": log_message,
-            "timestamp": None,
+            "timestamp": datetime.now(UTC),
         }
 
         await self.broadcast_to_issue(ticket_id, log_event)
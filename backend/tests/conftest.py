@@ -36,6 +36,18 @@ class MockNeo4jDB:
             return MockNeo4jResult(self.results.pop(0))
         return MockNeo4jResult([])
 
+    def execute_read(
+        self,
+        query: str,
+        params: dict | None = None,
+        cached: bool = False,
+        parallel: bool = False,
+    ) -> MockNeo4jResult:
+        return self.execute_query(query, params)
+
+    def execute_write(self, query: str, params: dict | None = None) -> MockNeo4jResult:
+        return self.execute_query(query, params)
+
     def add_result(self, data: list[dict[str, Any]]):
         self.results.append(data)
 
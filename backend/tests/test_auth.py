@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.utils.auth import (
     create_access_token,
+    create_user_token,
     decode_access_token,
     get_password_hash,
     verify_password,
@@ -62,6 +63,18 @@ def test_jwt_tokens():
     return True
 
 
+def test_user_token():
+    """Test du token JWT créé pour un utilisateur"""
+    from types import SimpleNamespace
+
+    user = SimpleNamespace(id="user-789", username="jane_doe")
+    payload = decode_access_token(create_user_token(user))
+
+    assert payload is not None, "❌ Le décodage a échoué"
+    assert payload["sub"] == "jane_doe"
+    assert payload["user_id"] == "user-789"
+
+
 def test_auth_workflow():
     """Test du workflow complet d'authentification"""
     print("\n🧪 Test du workflow d'authentification...")
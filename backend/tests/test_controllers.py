@@ -8,6 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.models.oauth.user import User
+from src.utils.auth import get_current_user
 from tests.conftest import MockNeo4jDB
 
 
@@ -222,3 +223,118 @@ class TestCopilotAssignmentEndpoints:
         mock_db.add_result([])
         resp = client.post("/api/copilot/assign/issue-missing", json={})
         assert resp.status_code == 404
+
+    def test_assign_to_copilot_without_token_skips_db(
+        self, app, client: TestClient, mock_db: MockNeo4jDB, mock_user
+    ):
+        app.dependency_overrides[get_current_user] = lambda: mock_user.model_copy(
+            update={"github_token": None}
+        )
+        resp = client.post("/api/copilot/assign/issue-1", json={})
+        assert resp.status_code == 401
+        assert mock_db.executed_queries == []
+
+
+# --------------- M3 endpoints ---------------
+
+
+class TestM3Endpoints:
+    def test_edge_constraints_served_precomputed(self, client: TestClient):
+        from src.models.MDE.M3.m3_config import M3Config
+
+        resp = client.get("/api/m3/edge-constraints")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == M3Config.get_edge_constraints()
+
+
+class TestMetamodelGraphResponse:
+    def test_orjson_payload_matches_response_model(self):
+        import orjson
+
+        from src.controllers.MDE.M2.metamodel_controller import _graph_response
+        from src.models.MDE.M2 import Metamodel, MetamodelGraphResponse
+
+        metamodel = Metamodel(id="mm-1", name="Shop", version="1.0", owner_id="testuser")
+        graph_data = {
+            "metamodel": metamodel,
+            "nodes": [{"id": "c1", "name": "Car", "type": "concept", "x": 1.5, "y": None}],
+            "edges": [{"id": "e1", "source": "c1", "target": "c1", "directed": True}],
+            "edgeConstraints": metamodel.allowed_edge_types,
+        }
+
+        resp = _graph_response(graph_data)
+        expected = MetamodelGraphResponse.model_validate(graph_data).model_dump(
+            mode="json", by_alias=True
+        )
+        assert resp.media_type == "application/json"
+        assert orjson.loads(resp.body) == expected
+
+
+class TestOrjsonResponse:
+    def test_matches_fastapi_encoding(self):
+        import orjson
+        from fastapi.encoders import jsonable_encoder
+
+        from src.models.repository.message import Message
+        from src.utils.responses import orjson_response
+
+        messages = [Message(id="msg-1", content="Hello", issue_id="issue-1")]
+        resp = orjson_response(messages)
+        assert resp.media_type == "application/json"
+        assert orjson.loads(resp.body) == jsonable_encoder(messages)
+
+    def test_exclude_none_matches_fastapi_encoding(self):
+        import orjson
+        from fastapi.encoders import jsonable_encoder
+
+        from src.models.repository.repository import Repository
+        from src.utils.responses import orjson_response
+
+        repos = [Repository(id="r1", name="demo", full_name="me/demo", owner_username="me")]
+        resp = orjson_response(repos, exclude_none=True)
+        payload = orjson.loads(resp.body)
+        assert payload == jsonable_encoder(repos, exclude_none=True)
+        assert "github_id" not in payload[0]
+
+    def test_graph_dict_datetimes_match_isoformat(self):
+        from datetime import datetime
+
+        import orjson
+
+        from src.models.MDE.M2.metamodel_edge import MetamodelEdge, MetamodelEdgeType
+        from src.utils.responses import serialize_graph_dict
+
+        created = datetime(2024, 5, 1, 12, 30, 15, 123456)
+        edge = MetamodelEdge(
+            id="e1",
+            name="domain",
+            graph_id="mm",
+            edge_type=MetamodelEdgeType.DOMAIN,
+            source_id="a",
+            target_id="b",
+            created_at=created,
+        )
+        payload = orjson.loads(serialize_graph_dict(edge.to_graph_dict()))
+        assert payload["created_at"] == created.isoformat()
+        assert payload["updated_at"] is None
+
+
+class TestEdgeEndpoints:
+    def test_create_edge_returns_201_graph_dict(self, client: TestClient, mock_db: MockNeo4jDB):
+        mock_db.add_result([{"edge_count": 0}])
+        mock_db.add_result(
+            [{"source_id": "r1", "source_label": "owns", "target_id": "c1", "target_label": "Car"}]
+        )
+
+        resp = client.post(
+            "/api/edges/",
+            json={"edge_type": "domain", "source_id": "r1", "target_id": "c1", "graph_id": "mm"},
+        )
+        assert resp.status_code == 201, resp.text
+        assert resp.json()["id"] == "domain-r1-c1"
+
+        operation = client.get("/openapi.json").json()["paths"]["/api/edges/"]["post"]
+        assert "201" in operation["responses"]
+        # Plus de schéma dict[str, Any] dérivé de l'annotation
+        assert operation["responses"]["200"]["content"]["application/json"]["schema"] == {}
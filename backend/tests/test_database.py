@@ -0,0 +1,142 @@
+"""Tests for the Neo4j connection helpers."""
+
+from __future__ import annotations
+
+from src.database import QueryCache
+
+
+class TestQueryCache:
+    def test_key_is_stable_across_param_order(self):
+        key_a = QueryCache.make_key("MATCH (n) RETURN n", {"a": 1, "b": 2})
+        key_b = QueryCache.make_key("MATCH (n) RETURN n", {"b": 2, "a": 1})
+        assert key_a == key_b
+
+    def test_expired_entries_are_dropped(self):
+        cache = QueryCache(ttl=-1)
+        key = QueryCache.make_key("RETURN 1", None)
+        cache.set(key, "RETURN 1", ["row"])
+        assert cache.get(key) is None
+
+    def test_lru_eviction(self):
+        cache = QueryCache(maxsize=1)
+        cache.set(b"a", "q1", 1)
+        cache.set(b"b", "q2", 2)
+        assert cache.get(b"a") is None
+        assert cache.get(b"b") == 2
+
+    def test_invalidate_by_pattern(self):
+        cache = QueryCache()
+        cache.set(b"u", "MATCH (n:User) RETURN n", 1)
+        cache.set(b"c", "MATCH (n:Concept) RETURN n", 2)
+        cache.invalidate(":User")
+        assert cache.get(b"u") is None
+        assert cache.get(b"c") == 2
+
+    def test_read_started_before_invalidation_is_not_stored(self):
+        cache = QueryCache()
+        generation = cache.generation
+        cache.invalidate()
+        cache.set(b"m", "MATCH (m:Metamodel) RETURN m", ["stale"], generation)
+        assert cache.get(b"m") is None
+
+
+class TestNeo4jConnection:
+    def test_singleton_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.database import Neo4jConnection, db
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: Neo4jConnection(), range(32)))
+        assert all(instance is db for instance in instances)
+
+    def test_single_canonical_module(self):
+        """Relative and absolute imports must share one module, hence one driver pool."""
+        import importlib
+
+        import src.database
+
+        consumers = (
+            "src.utils.auth",
+            "src.controllers.oauth.auth_controller",
+            "src.controllers.repository.issue_controller",
+            "src.controllers.MDE.M2.concept_controller",
+            "src.controllers.MDE.M2.metamodel_controller",
+        )
+        for name in consumers:
+            module = importlib.import_module(name)
+            assert module.get_db is src.database.get_db, name
+
+    async def test_verify_connectivity_is_memoized(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.database import Neo4jConnection
+
+        conn = Neo4jConnection()
+        previous = conn.driver, conn._last_ok
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock()
+        conn.driver, conn._last_ok = driver, 0.0
+        try:
+            assert await conn.verify_connectivity() is True
+            assert await conn.verify_connectivity() is True
+            driver.verify_connectivity.assert_awaited_once()
+        finally:
+            conn.driver, conn._last_ok = previous
+
+    async def test_init_constraints_creates_mde_indexes(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.database import CONSTRAINTS, INDEXES, Neo4jConnection
+
+        tx = MagicMock()
+        tx.run = AsyncMock()
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+
+        async def execute_write(work):
+            return await work(tx)
+
+        session.execute_write = AsyncMock(side_effect=execute_write)
+        driver = MagicMock()
+        driver.session.return_value = session
+
+        conn = Neo4jConnection()
+        previous = conn.driver
+        conn.driver = driver
+        try:
+            await conn.init_constraints()
+        finally:
+            conn.driver = previous
+
+        session.execute_write.assert_awaited_once()
+        statements = [call.args[0] for call in tx.run.await_args_list]
+        assert statements == [*CONSTRAINTS, *INDEXES]
+        assert any("(c.graph_id, c.name)" in s for s in INDEXES)
+
+    async def test_parallel_runtime_prefix_is_opt_in(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.database import Neo4jConnection
+
+        driver = MagicMock()
+        driver.execute_query = AsyncMock(return_value=([], None, None))
+        conn = Neo4jConnection()
+        previous = conn.driver, conn.parallel_runtime
+        conn.driver = driver
+        try:
+            conn.parallel_runtime = False
+            await conn.execute_read("MATCH (n) RETURN n", parallel=True)
+            conn.parallel_runtime = True
+            await conn.execute_read("MATCH (n) RETURN n")
+            await conn.execute_read("MATCH (n) RETURN n", parallel=True)
+        finally:
+            conn.driver, conn.parallel_runtime = previous
+
+        queries = [call.args[0] for call in driver.execute_query.await_args_list]
+        assert queries == [
+            "MATCH (n) RETURN n",
+            "MATCH (n) RETURN n",
+            "CYPHER runtime=parallel MATCH (n) RETURN n",
+        ]
@@ -518,3 +518,105 @@ class TestSchemaExport:
         assert isinstance(serialized, str)
         deserialized = json.loads(serialized)
         assert deserialized["title"] == "IRGraph"
+
+
+class TestSaveIRGraph:
+    """The save endpoint writes every timestamp in the same ISO 8601 format."""
+
+    async def test_saved_timestamps_are_isoformat(self, tmp_path, monkeypatch):
+        from unittest.mock import AsyncMock, patch
+
+        from src.controllers import ir_controller
+        from src.models.MDE.M2.concept import Concept
+        from src.models.MDE.M2.metamodel import Metamodel
+        from src.models.MDE.M3.m3_config import CONCEPT_NODE_TYPE
+        from src.services.MDE.M2.metamodel_service import MetamodelService
+
+        created = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        metamodel = Metamodel(
+            id="mm-1", name="M", version="1.0.0", owner_id="u", created_at=created
+        )
+        concept = Concept(
+            id="c1", name="Car", graph_id="mm-1", node_type=CONCEPT_NODE_TYPE, created_at=created
+        )
+        graph = {"metamodel": metamodel, "nodes": [concept.to_graph_dict()], "edges": []}
+
+        monkeypatch.setattr(ir_controller, "IR_STORAGE_DIR", tmp_path)
+        with patch.object(
+            MetamodelService, "get_metamodel_with_graph", AsyncMock(return_value=graph)
+        ):
+            await ir_controller.save_ir_graph("mm-1", current_user=None, db=None, controller=None)
+
+        saved = json.loads((tmp_path / "mm-1.json").read_text(encoding="utf-8"))
+        assert saved["metadata"]["created_at"] == created.isoformat()
+        assert saved["nodes"][0]["created_at"] == created.isoformat()
+        assert validate_ir_graph(saved) == []
+
+
+class TestLoadIRGraph:
+    """Batch creation during IR loads only skips the invalid items."""
+
+    async def test_concepts_fall_back_to_one_by_one(self):
+        from unittest.mock import AsyncMock
+
+        from src.controllers.ir_controller import _create_concepts
+
+        concept_repo = AsyncMock()
+        concept_repo.bulk_create.side_effect = RuntimeError("constraint violation")
+
+        async def create(concept):
+            if concept["id"] == "bad":
+                raise ValueError("duplicate id")
+
+        concept_repo.create.side_effect = create
+        concepts = [{"id": "c1"}, {"id": "bad"}, {"id": "c2"}]
+
+        assert await _create_concepts(concept_repo, concepts) == 2
+        assert concept_repo.create.await_count == 3
+
+    async def test_edge_with_missing_endpoint_is_skipped_alone(self):
+        from src.controllers.ir_controller import _create_edges
+        from src.models.MDE.M2.metamodel_edge import MetamodelEdgeType
+        from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
+        from tests.conftest import MockNeo4jDB
+
+        db = MockNeo4jDB()
+        # L'UNWIND ne renvoie que les edges dont les deux noeuds existent
+        db.add_result(
+            [
+                {"source_id": "r1", "source_label": "a", "target_id": "c1", "target_label": "A"},
+                {"source_id": "r2", "source_label": "b", "target_id": "c1", "target_label": "A"},
+            ]
+        )
+        domain = MetamodelEdgeType.DOMAIN
+        edges = [
+            {"id": "e1", "source_id": "r1", "target_id": "c1", "edge_type": domain},
+            {"id": "e2", "source_id": "r9", "target_id": "gone", "edge_type": domain},
+            {"id": "e3", "source_id": "r2", "target_id": "c1", "edge_type": domain},
+        ]
+
+        assert await _create_edges(MetamodelEdgeRepository(db), "mm-1", edges) == 2
+
+    async def test_edges_fall_back_to_one_by_one(self):
+        from unittest.mock import AsyncMock
+
+        from src.controllers.ir_controller import _create_edges
+        from src.models.MDE.M2.metamodel_edge import MetamodelEdgeType
+
+        edge_repo = AsyncMock()
+        edge_repo.create_edges_bulk.side_effect = RuntimeError("transaction failed")
+
+        async def create_edge(metamodel_id, source_id, target_id, edge_type):
+            if target_id == "gone":
+                raise ValueError("Failed to create domain edge")
+
+        edge_repo.create_edge.side_effect = create_edge
+        domain = MetamodelEdgeType.DOMAIN
+        edges = [
+            {"id": "e1", "source_id": "r1", "target_id": "c1", "edge_type": domain},
+            {"id": "e2", "source_id": "r9", "target_id": "gone", "edge_type": domain},
+            {"id": "e3", "source_id": "r2", "target_id": "c1", "edge_type": domain},
+        ]
+
+        assert await _create_edges(edge_repo, "mm-1", edges) == 2
+        assert edge_repo.create_edge.await_count == 3
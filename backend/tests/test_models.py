@@ -1,5 +1,15 @@
 """Tests for data models"""
 
+import pytest
+
+from src.models.MDE.M2 import (
+    AttributeResponse,
+    ConceptResponse,
+    MetamodelEdgeResponse,
+    MetamodelResponse,
+    RelationshipResponse,
+)
+from src.models.MDE.M2.metamodel import MetamodelCreate
 from src.models.graph.node_type import NodeType
 from src.models.graph.edge_type import EdgeType
 from src.models.repository.issue import IssueCreate
@@ -42,3 +52,273 @@ def test_repository_create():
     data = RepositoryCreate(name="test-repo", description="A test repo", private=False)
     assert data.name == "test-repo"
     assert data.private is False
+
+
+def test_metamodel_legacy_aliases():
+    data = MetamodelCreate(name="Shop", version="1.0", concepts=3, relations=2)
+    assert data.node_count == 3
+    assert data.edge_count == 2
+    assert data.concepts == 3
+    assert data.relations == 2
+    assert "concepts" not in data.model_dump()
+
+
+@pytest.mark.parametrize(
+    "response_cls",
+    [
+        AttributeResponse,
+        ConceptResponse,
+        MetamodelEdgeResponse,
+        MetamodelResponse,
+        RelationshipResponse,
+    ],
+)
+def test_response_models_reuse_parent_schema(response_cls):
+    """*Response schemas must stay plain subclasses: same fields, same config as the entity"""
+    parent = response_cls.__bases__[0]
+    assert response_cls.model_fields.keys() == parent.model_fields.keys()
+    assert response_cls.model_config == parent.model_config
+
+
+def test_relationship_type_single_definition():
+    """Every export path must resolve to the same enum class (lazy package __getattr__)"""
+    import src.models
+    import src.models.MDE
+    import src.models.MDE.M2
+    from src.models.MDE.M2.relationship import RelationshipType
+
+    for package in (src.models, src.models.MDE, src.models.MDE.M2):
+        assert package.RelationshipType is RelationshipType
+
+
+def test_metamodel_update_legacy_keys_map_to_counts():
+    from src.models.MDE.M2 import MetamodelUpdate
+
+    updates = MetamodelUpdate(concepts=4)
+    assert updates.model_dump(exclude_unset=True) == {"node_count": 4}
+    assert updates.concepts == 4
+
+
+def test_batch_timestamp_shared_by_entities():
+    from src.models.base import BaseEntity, batch_timestamp
+
+    with batch_timestamp() as now:
+        first = BaseEntity(id="a")
+        second = BaseEntity(id="b")
+    assert first.created_at == second.created_at == now
+    assert first.created_at.tzinfo is None
+    assert BaseEntity(id="c").created_at >= now
+
+
+def test_metamodel_edge_is_frozen():
+    from pydantic import ValidationError
+
+    from src.models.MDE.M2 import MetamodelEdgeRow, MetamodelEdgeType
+
+    row = MetamodelEdgeRow(
+        id="domain-r1-c1",
+        name="domain-owns-Car",
+        edge_type=MetamodelEdgeType.DOMAIN,
+        source_id="r1",
+        target_id="c1",
+    )
+    edge = row.to_model("mm-1")
+    with pytest.raises(ValidationError):
+        edge.source_id = "r2"
+
+
+def test_metamodel_edge_type_from_value():
+    from src.models.MDE.M2 import MetamodelEdgeType
+
+    assert MetamodelEdgeType.from_value("HAS_ATTRIBUTE") is MetamodelEdgeType.HAS_ATTRIBUTE
+    assert MetamodelEdgeType.from_value("domain") is MetamodelEdgeType.DOMAIN
+    assert MetamodelEdgeType.from_value("unknown") is None
+
+
+def test_m3_validate_edge_matches_edge_types():
+    from itertools import product
+
+    from src.models.MDE.M3.m3_config import EDGE_TYPES, M3Config
+
+    node_type_ids = ["concept", "attribute", "relation", "unknown"]
+    for edge_type in EDGE_TYPES:
+        for source, target in product(node_type_ids, repeat=2):
+            assert M3Config.validate_edge(edge_type.name, source, target) == (
+                edge_type.allows_connection(source, target)
+            )
+    assert M3Config.validate_edge("unknown", "concept", "concept") is False
+
+
+def test_entity_schema_build_is_deferred():
+    from src.models.base import ENTITY_CONFIG, BaseEntity
+
+    assert ENTITY_CONFIG["defer_build"] is True
+    assert "from_attributes" not in ENTITY_CONFIG
+    # Le schéma se construit à la première validation
+    assert BaseEntity(id="x").id == "x"
+
+
+def test_semantic_entity_keeps_field_order():
+    from src.models.base import BaseSemanticModel, SemanticEntity, TimestampMixin
+    from src.models.repository.repository import Repository
+
+    # Bases abstraites : jamais validées directement, schéma jamais construit
+    assert TimestampMixin.model_config["defer_build"] is True
+    assert BaseSemanticModel.model_config["defer_build"] is True
+    assert issubclass(Repository, SemanticEntity)
+    assert list(Repository.model_fields)[:5] == [
+        "name",
+        "description",
+        "created_at",
+        "updated_at",
+        "id",
+    ]
+
+
+def test_graph_csr_neighbors():
+    from src.models.MDE.M2.concept import Concept
+    from src.models.MDE.M2.metamodel import Metamodel
+    from src.models.MDE.M2.metamodel_edge import MetamodelEdge, MetamodelEdgeType
+
+    mm = Metamodel(id="mm", name="MM", version="1.0")
+    nodes = [Concept.model_construct(id=f"c{i}", name=f"C{i}", graph_id="mm") for i in range(3)]
+
+    def edge(source, target):
+        return MetamodelEdge.model_construct(
+            id=f"{source}-{target}",
+            graph_id="mm",
+            edge_type=MetamodelEdgeType.DOMAIN,
+            source_id=source,
+            target_id=target,
+        )
+
+    edges = [edge("c2", "c0"), edge("c0", "c1"), edge("c0", "c2"), edge("c0", "missing")]
+
+    with pytest.raises(RuntimeError):
+        mm.neighbors(0)
+
+    indptr, indices = mm.build_csr(nodes, edges)
+
+    assert indptr.tolist() == [0, 2, 2, 3]
+    assert mm.neighbors(0).tolist() == [1, 2]
+    assert mm.neighbors(1).tolist() == []
+    assert mm.neighbors(2).tolist() == [0]
+    assert "_csr" not in mm.model_dump()
+
+
+def test_graph_counters_bulk_update():
+    from src.models.MDE.M2.metamodel import Metamodel
+
+    mm = Metamodel(id="mm", name="MM", version="1.0")
+    mm.increment_node_count()
+    mm.increment_edge_count()
+    mm.decrement_edge_count()
+    mm.decrement_edge_count()
+    assert mm.get_metrics() == {"nodes": 1, "edges": 0}
+
+    mm.bulk_update(node_delta=4, edge_delta=3)
+    assert mm.get_metrics() == {"nodes": 5, "edges": 3}
+    mm.bulk_update(node_delta=-10)
+    assert mm.node_count == 0
+    assert mm.model_dump()["edge_count"] == 3
+
+
+def test_graph_hooks_are_class_constants():
+    from src.models.MDE.M2.metamodel import Metamodel
+    from src.models.MDE.M2.metamodel_edge import MetamodelEdge
+
+    mm = Metamodel(id="mm", name="MM", version="1.0")
+    assert Metamodel.graph_type == mm.get_graph_type() == "metamodel"
+    assert mm.to_graph_dict()["type"] == "metamodel"
+    assert MetamodelEdge.directed is True
+    assert "graph_type" not in mm.model_dump()
+    assert "directed" not in MetamodelEdge.model_fields
+
+
+def test_graph_ids_are_interned():
+    import sys
+
+    from src.models.MDE.M2.concept import Concept
+    from src.models.MDE.M2.metamodel_edge import MetamodelEdge, MetamodelEdgeType
+    from src.models.MDE.M3.m3_config import M3Config
+
+    graph_id = "".join(["mm-", "42"])
+    other = "".join(["mm-", "42"])
+    assert graph_id is not other
+
+    concept = Concept(
+        id="c1", name="C", graph_id=graph_id, node_type=M3Config.get_node_type("concept")
+    )
+    edge = MetamodelEdge(
+        id="e1",
+        name="domain",
+        graph_id=other,
+        edge_type=MetamodelEdgeType.DOMAIN,
+        source_id="".join(["c", "1"]),
+        target_id="c2",
+    )
+    assert concept.graph_id is edge.graph_id
+    assert edge.source_id is sys.intern("c1")
+
+
+def test_graph_positions_array():
+    import math
+
+    from src.models.MDE.M2.concept import Concept
+    from src.models.MDE.M2.metamodel import Metamodel
+
+    mm = Metamodel(id="mm", name="MM", version="1.0")
+    nodes = [
+        Concept.model_construct(id="c0", graph_id="mm", x_position=1.5, y_position=-2.0),
+        Concept.model_construct(id="c1", graph_id="mm", x_position=None, y_position=None),
+    ]
+
+    with pytest.raises(RuntimeError):
+        mm.get_node_position("c0")
+
+    positions = mm.build_positions(nodes)
+    assert positions.shape == (2, 2)
+    assert positions.dtype.name == "float32"
+    assert mm.get_node_position("c0").tolist() == [1.5, -2.0]
+    assert all(math.isnan(v) for v in mm.get_node_position("c1"))
+
+    # L'adjacence, même sur un autre jeu de nœuds, ne touche pas aux positions
+    mm.build_csr(nodes[:1], [])
+    assert mm.get_node_position("c0").tolist() == [1.5, -2.0]
+    mm.build_positions(nodes[1:])
+    assert mm.neighbors(0).tolist() == []
+
+
+def test_user_email_shape_check():
+    from pydantic import ValidationError
+
+    from src.models.oauth.user import UserCreate
+
+    assert UserCreate(username="octocat", email="octo@github.com").email == "octo@github.com"
+    assert UserCreate(username="octocat").email is None
+    with pytest.raises(ValidationError):
+        UserCreate(username="octocat", email="not-an-email")
+
+
+def test_user_public_from_user_hides_token():
+    from src.models.oauth.user import User, UserPublic
+
+    user = User(id="u1", username="octocat", email="octo@github.com", github_token="secret")
+    public = UserPublic.from_user(user)
+    assert public.github_token is True
+    assert public.model_dump() == {
+        "id": "u1",
+        "username": "octocat",
+        "email": "octo@github.com",
+        "avatar_url": None,
+        "is_active": True,
+        "github_token": True,
+    }
+
+
+def test_metamodel_status_formats_as_value():
+    from src.models.MDE.M2.metamodel import MetamodelStatus
+
+    assert str(MetamodelStatus.DRAFT) == "draft"
+    assert f"{MetamodelStatus.VALIDATED}" == "validated"
+    assert MetamodelStatus("deprecated") is MetamodelStatus.DEPRECATED
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
+from src.models.MDE.M2 import MetamodelEdge, MetamodelEdgeRow, MetamodelEdgeType
 from src.repositories.base import BaseRepository, prepare_neo4j_properties
+from src.repositories.MDE.M2.concept_repository import ConceptRepository
+from src.repositories.MDE.M2.metamodel_edge_repository import MetamodelEdgeRepository
+from src.repositories.oauth.user_repository import GET_BY_USERNAME_QUERY, UserRepository
 from src.repositories.repository.issue_repository import IssueRepository
+from src.repositories.repository.message_repository import MessageRepository
 from src.repositories.repository.repository_repository import RepositoryRepository
-from tests.conftest import MockNeo4jDB, MockNeo4jResult
+from tests.conftest import MockNeo4jDB
 
 
 class _ConcreteRepo(BaseRepository):
@@ -43,6 +50,15 @@ class TestPrepareNeo4jProperties:
         result = prepare_neo4j_properties(data)
         assert result["items"] == '[{"x": 1}, {"x": 2}]'
 
+    def test_scalars_returned_in_a_copy(self):
+        from src.models.MDE.M2.attribute import AttributeType
+
+        data = {"name": "hello", "nothing": None}
+        result = prepare_neo4j_properties(data)
+        assert result == data and result is not data
+        # str subclasses (enums) are kept unchanged
+        assert prepare_neo4j_properties({"type": AttributeType.STRING})["type"] == "string"
+
     def test_unknown_type_stringified(self):
         data = {"obj": object()}
         result = prepare_neo4j_properties(data)
@@ -150,6 +166,164 @@ class TestBaseRepositoryDelete:
         assert not await repo.delete("missing")
 
 
+# ---------------------------------------------------------------------------
+# UserRepository
+# ---------------------------------------------------------------------------
+
+
+class TestUserRepository:
+    async def test_get_by_username_uses_constant_query(self, mock_db: MockNeo4jDB, mock_user):
+        mock_db.add_result([{"n": mock_user.model_dump()}])
+        repo = UserRepository(mock_db)
+
+        result = await repo.get_by_username("testuser")
+        assert result is not None
+        assert result.username == "testuser"
+        assert mock_db.executed_queries[-1] == (GET_BY_USERNAME_QUERY, {"username": "testuser"})
+
+
+# ---------------------------------------------------------------------------
+# MetamodelEdgeRepository
+# ---------------------------------------------------------------------------
+
+
+class TestMetamodelEdgeRepository:
+    async def test_get_graph_rows_builds_rows(self, mock_db: MockNeo4jDB):
+        # Une seule requête UNION ALL, chaque record porte son type d'edge
+        mock_db.add_result(
+            [
+                {
+                    "source_id": "r1",
+                    "source_label": "owns",
+                    "target_id": "c1",
+                    "target_label": "Car",
+                    "edge_type": "domain",
+                }
+            ]
+        )
+        repo = MetamodelEdgeRepository(mock_db)
+
+        rows = await repo.get_graph_rows("mm-1")
+        assert len(rows) == 1
+        row = rows[0]
+        assert isinstance(row, MetamodelEdgeRow)
+        assert row.id == "domain-r1-c1"
+        assert row.description == "Domain of owns"
+        assert row.edge_type == MetamodelEdgeType.DOMAIN
+        # Même payload que le modèle Pydantic (hors timestamps, non stockés sur les edges)
+        expected = row.to_model("mm-1").to_graph_dict()
+        expected.update(created_at=None, updated_at=None)
+        assert row.to_graph_dict() == expected
+
+    async def test_get_by_metamodel_returns_models(self, mock_db: MockNeo4jDB):
+        mock_db.add_result(
+            [
+                {
+                    "source_id": "c1",
+                    "source_label": "Car",
+                    "target_id": "a1",
+                    "target_label": "vin",
+                    "edge_type": "has_attribute",
+                },
+                {
+                    "source_id": "c2",
+                    "source_label": "Truck",
+                    "target_id": "c1",
+                    "target_label": "Car",
+                    "edge_type": "subclass_of",
+                },
+            ]
+        )
+        repo = MetamodelEdgeRepository(mock_db)
+
+        edges = await repo.get_by_metamodel("mm-1")
+        assert len(mock_db.executed_queries) == 1
+        assert mock_db.executed_queries[0][0].count("UNION ALL") == 3
+        assert [e.edge_type for e in edges] == [
+            MetamodelEdgeType.HAS_ATTRIBUTE,
+            MetamodelEdgeType.SUBCLASS_OF,
+        ]
+        assert isinstance(edges[0], MetamodelEdge)
+        assert edges[0].description == "Car has vin"
+        assert edges[1].description == "Truck is a Car"
+        assert edges[0].graph_id == "mm-1"
+
+    async def test_create_edges_bulk_one_query_per_type(self, mock_db: MockNeo4jDB):
+        mock_db.add_result(
+            [
+                {
+                    "source_id": "r1",
+                    "source_label": "owns",
+                    "target_id": "c1",
+                    "target_label": "Car",
+                },
+                {
+                    "source_id": "r2",
+                    "source_label": "uses",
+                    "target_id": "c1",
+                    "target_label": "Car",
+                },
+            ]
+        )
+        # Attribut introuvable : aucun record retourné pour cette ligne
+        mock_db.add_result([])
+        repo = MetamodelEdgeRepository(mock_db)
+
+        edges = await repo.create_edges_bulk(
+            "mm-1",
+            [
+                {"source_id": "r2", "target_id": "c1", "edge_type": MetamodelEdgeType.DOMAIN},
+                {
+                    "source_id": "c1",
+                    "target_id": "gone",
+                    "edge_type": MetamodelEdgeType.HAS_ATTRIBUTE,
+                },
+                {"source_id": "r1", "target_id": "c1", "edge_type": MetamodelEdgeType.DOMAIN},
+            ],
+        )
+
+        assert len(mock_db.executed_queries) == 2
+        (domain_query, domain_params), (attr_query, attr_params) = mock_db.executed_queries
+        assert "UNWIND $rows" in domain_query and ":DOMAIN]" in domain_query
+        # Lignes triées par source_id dans chaque lot
+        assert [row["source_id"] for row in domain_params["rows"]] == ["r1", "r2"]
+        assert "SET target.concept_id = row.source_id" in attr_query
+        assert attr_params == {"rows": [{"source_id": "c1", "target_id": "gone"}]}
+        assert [e.id for e in edges] == ["domain-r1-c1", "domain-r2-c1"]
+        assert all(e.graph_id == "mm-1" for e in edges)
+
+    async def test_create_edge_checks_with_a_read(self, mock_db: MockNeo4jDB):
+        mock_db.add_result([{"edge_count": 0}])
+        mock_db.add_result(
+            [{"source_id": "c1", "source_label": "Car", "target_id": "a1", "target_label": "vin"}]
+        )
+        repo = MetamodelEdgeRepository(mock_db)
+
+        with patch.object(mock_db, "execute_write", wraps=mock_db.execute_write) as write:
+            edge = await repo.create_edge("mm-1", "c1", "a1", MetamodelEdgeType.HAS_ATTRIBUTE)
+
+        # Seule la création passe par une transaction d'écriture
+        assert write.call_count == 1
+        create_query, create_params = mock_db.executed_queries[1]
+        assert "SET target.concept_id = $source_id" in create_query
+        assert create_params == {"source_id": "c1", "target_id": "a1"}
+        assert edge.id == "has_attribute-c1-a1"
+        assert edge.target_label == "vin"
+
+    async def test_create_edge_rejects_existing(self, mock_db: MockNeo4jDB):
+        mock_db.add_result([{"edge_count": 1}])
+        repo = MetamodelEdgeRepository(mock_db)
+
+        with pytest.raises(ValueError):
+            await repo.create_edge("mm-1", "r1", "c1", MetamodelEdgeType.DOMAIN)
+        assert len(mock_db.executed_queries) == 1
+
+    async def test_create_edges_bulk_empty(self, mock_db: MockNeo4jDB):
+        repo = MetamodelEdgeRepository(mock_db)
+        assert await repo.create_edges_bulk("mm-1", []) == []
+        assert mock_db.executed_queries == []
+
+
 # ---------------------------------------------------------------------------
 # RepositoryRepository
 # ---------------------------------------------------------------------------
@@ -189,6 +363,141 @@ class TestRepositoryRepository:
         assert results[0].owner_username == "testuser"
 
 
+# ---------------------------------------------------------------------------
+# MessageRepository
+# ---------------------------------------------------------------------------
+
+
+class TestMessageRepository:
+    async def test_get_by_issue_builds_messages(self, mock_db: MockNeo4jDB):
+        from src.models.repository.message import Message
+
+        row = {"id": "msg-1", "content": "Hello", "issue_id": "issue-1", "author_type": "copilot"}
+        mock_db.add_result([{"n": row}])
+        repo = MessageRepository(mock_db)
+
+        messages = await repo.get_by_issue("issue-1")
+        assert len(messages) == 1
+        assert isinstance(messages[0], Message)
+        assert messages[0].author_type == "copilot"
+        assert messages[0].github_comment_id is None
+
+    async def test_json_looking_content_is_not_accepted_as_a_dict(self, mock_db: MockNeo4jDB):
+        from pydantic import ValidationError
+
+        # convert_neo4j_types décode '{"a": 1}' : la validation doit le refuser
+        row = {"id": "msg-1", "content": '{"a": 1}', "issue_id": "issue-1"}
+        mock_db.add_result([{"n": row}])
+        repo = MessageRepository(mock_db)
+
+        with pytest.raises(ValidationError):
+            await repo.get_by_id("msg-1")
+
+
+class TestConceptRepository:
+    async def test_rows_get_node_type(self, mock_db: MockNeo4jDB):
+        from src.models.MDE.M2.concept import Concept
+
+        row = {"id": "c1", "name": "Car", "graph_id": "mm-1", "x": 10.0, "y": 20.0}
+        mock_db.add_result([{"c": row}])
+        repo = ConceptRepository(mock_db)
+
+        concepts = await repo.get_by_metamodel("mm-1")
+        assert isinstance(concepts[0], Concept)
+        assert concepts[0].node_type.name == "concept"
+        assert concepts[0].get_position() == (10.0, 20.0)
+        assert concepts[0].to_graph_dict()["label"] == "Car"
+        assert "node_type" not in row
+
+    async def test_json_looking_name_is_not_accepted_as_a_list(self, mock_db: MockNeo4jDB):
+        from pydantic import ValidationError
+
+        # convert_neo4j_types décode '["a", "b"]' : la validation doit le refuser
+        mock_db.add_result([{"c": {"id": "c1", "name": '["a", "b"]', "graph_id": "mm-1"}}])
+        repo = ConceptRepository(mock_db)
+
+        with pytest.raises(ValidationError):
+            await repo.get_by_metamodel("mm-1")
+
+    async def test_bulk_create_single_query(self, mock_db: MockNeo4jDB):
+        rows = [{"c": {"id": f"c{i}", "name": f"C{i}", "graph_id": "mm-1"}} for i in range(3)]
+        mock_db.add_result(rows)
+        repo = ConceptRepository(mock_db)
+
+        items = [{"id": f"c{i}", "name": f"C{i}", "graph_id": "mm-1"} for i in range(3)]
+        concepts = await repo.bulk_create(items)
+
+        assert [c.id for c in concepts] == ["c0", "c1", "c2"]
+        assert len(mock_db.executed_queries) == 1
+        query, params = mock_db.executed_queries[0]
+        assert "UNWIND $batch" in query
+        assert [p["id"] for p in params["batch"]] == ["c0", "c1", "c2"]
+
+    async def test_bulk_create_empty_skips_query(self, mock_db: MockNeo4jDB):
+        assert await ConceptRepository(mock_db).bulk_create([]) == []
+        assert mock_db.executed_queries == []
+
+    async def test_list_with_total_single_query(self, mock_db: MockNeo4jDB):
+        items = [{"id": "c1", "name": "Car", "graph_id": "mm-1"}]
+        mock_db.add_result([{"items": items, "total": 7}])
+        repo = ConceptRepository(mock_db)
+
+        concepts, total = await repo.list_with_total("mm-1", skip=0, limit=1)
+        assert [c.id for c in concepts] == ["c1"]
+        assert total == 7
+        assert len(mock_db.executed_queries) == 1
+
+    async def test_get_with_attributes(self, mock_db: MockNeo4jDB):
+        attr = {"id": "a1", "name": "speed", "type": "integer", "concept_id": "c1"}
+        concept = {"id": "c1", "name": "Car", "graph_id": "mm-1"}
+        mock_db.add_result([{"c": concept, "attributes": [attr, None]}])
+        repo = ConceptRepository(mock_db)
+
+        found = await repo.get_with_attributes("c1")
+        assert found["concept"].name == "Car"
+        assert found["attributes"] == [attr]
+        assert mock_db.executed_queries[0][1] == {"id": "c1"}
+
+    async def test_get_with_attributes_missing(self, mock_db: MockNeo4jDB):
+        mock_db.add_result([])
+        assert await ConceptRepository(mock_db).get_with_attributes("nope") is None
+
+    async def test_get_by_id_adds_node_type(self, mock_db: MockNeo4jDB):
+        mock_db.add_result([{"n": {"id": "c1", "name": "Car", "graph_id": "mm-1"}}])
+        repo = ConceptRepository(mock_db)
+
+        concept = await repo.get_by_id("c1")
+        assert concept.node_type.name == "concept"
+
+
+class TestListValidation:
+    async def test_attributes_validated_as_a_list(self, mock_db: MockNeo4jDB):
+        from src.models.MDE.M2.attribute import AttributeType
+        from src.repositories.MDE.M2.attribute_repository import AttributeRepository
+
+        rows = [
+            {"a": {"id": f"a{i}", "name": f"attr{i}", "graph_id": "mm-1", "type": "string"}}
+            for i in range(3)
+        ]
+        mock_db.add_result(rows)
+        repo = AttributeRepository(mock_db)
+
+        attributes = await repo.get_by_metamodel("mm-1")
+        assert [a.id for a in attributes] == ["a0", "a1", "a2"]
+        assert attributes[0].type is AttributeType.STRING
+        assert attributes[0].node_type.name == "attribute"
+
+    async def test_custom_init_models_built_one_by_one(self, mock_db: MockNeo4jDB):
+        from src.repositories.MDE.M2.metamodel_repository import MetamodelRepository
+
+        mock_db.add_result([{"n": {"id": "mm-1", "name": "Shop", "version": "1.0"}}])
+        repo = MetamodelRepository(mock_db)
+
+        metamodels = await repo.get_all()
+        # Metamodel.__init__ fills the M3 type constraints
+        assert metamodels[0].allowed_node_types
+
+
 # ---------------------------------------------------------------------------
 # IssueRepository
 # ---------------------------------------------------------------------------
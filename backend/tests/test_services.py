@@ -317,6 +317,33 @@ class TestMessageService:
         )
         assert result.id == "msg-1"
 
+    async def test_sync_maps_empty_github_comment_to_empty_content(self, mock_db):
+        from src.repositories.repository.message_repository import MessageRepository
+
+        # GitHub renvoie body=null pour un commentaire vide : la synchro continue
+        comments = [
+            {"id": 7, "html_url": "https://gh/c/7", "body": None, "user": {"login": "u"}},
+            {"id": 8, "html_url": "https://gh/c/8", "body": "LGTM", "user": {"login": "u"}},
+        ]
+        for comment in comments:
+            mock_db.add_result([])  # get_by_github_comment_id
+            row = {
+                "id": f"message-{comment['id']}",
+                "github_comment_id": comment["id"],
+                "content": comment["body"] or "",
+                "issue_id": "i1",
+            }
+            mock_db.add_result([{"n": row}])
+        service = MessageService(MessageRepository(mock_db))
+
+        with patch.object(service, "fetch_from_github_api", AsyncMock(return_value=comments)):
+            messages = await service.sync_from_github(
+                "token", issue_id="i1", owner="o", repo_name="r", pr_number=1
+            )
+
+        assert [m.content for m in messages] == ["", "LGTM"]
+        assert mock_db.executed_queries[1][1]["props"]["content"] == ""
+
 
 # ---------------------------------------------------------------------------
 # User Service
@@ -374,3 +401,49 @@ class TestUserService:
             user = await service.get_or_create_from_github("token")
             assert user.username == "existing"
             mock_user_repo.update.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Metamodel Service
+# ---------------------------------------------------------------------------
+
+
+class TestMetamodelService:
+    async def test_get_metamodel_with_graph_filters_orphans(self):
+        from src.services.MDE.M2.metamodel_service import MetamodelService
+
+        def node(node_id):
+            n = MagicMock()
+            n.to_graph_dict.return_value = {"id": node_id}
+            return n
+
+        def edge(edge_id, source, target):
+            e = MagicMock()
+            e.to_graph_dict.return_value = {
+                "id": edge_id,
+                "source": source,
+                "target": target,
+                "type": "domain",
+            }
+            return e
+
+        metamodel_repo = AsyncMock()
+        metamodel_repo.get_by_id.return_value = MagicMock(allowed_edge_types=[])
+        concept_repo = AsyncMock()
+        concept_repo.get_by_metamodel.return_value = [node("c1")]
+        relationship_repo = AsyncMock()
+        relationship_repo.get_by_metamodel.return_value = [node("r1")]
+        edge_repo = AsyncMock()
+        edge_repo.get_graph_rows.return_value = [edge("e1", "r1", "c1"), edge("e2", "r1", "gone")]
+
+        # Pas de repository d'attributs : sa lecture est remplacée par une liste vide
+        service = MetamodelService(
+            metamodel_repo,
+            concept_repository=concept_repo,
+            relationship_repository=relationship_repo,
+            edge_repository=edge_repo,
+        )
+        graph = await service.get_metamodel_with_graph("mm-1")
+
+        assert [n["id"] for n in graph["nodes"]] == ["c1", "r1"]
+        assert [e["id"] for e in graph["edges"]] == ["e1"]
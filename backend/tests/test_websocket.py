@@ -0,0 +1,47 @@
+"""Tests for the WebSocket connection manager."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import orjson
+
+from src.websocket.connection_manager import ConnectionManager
+
+
+class TestConnectionManager:
+    async def test_broadcast_sends_same_payload_to_all(self):
+        manager = ConnectionManager()
+        issue_ws, global_ws = AsyncMock(), AsyncMock()
+        await manager.connect(issue_ws, "issue-1")
+        await manager.connect(global_ws)
+
+        await manager.send_log("issue-1", "INFO", "hello")
+
+        sent = issue_ws.send_text.await_args.args[0]
+        assert global_ws.send_text.await_args.args[0] is sent
+        assert orjson.loads(sent)["message"] == "hello"
+
+    async def test_broadcast_drops_dead_connections(self):
+        manager = ConnectionManager()
+        dead_ws = AsyncMock()
+        dead_ws.send_text.side_effect = RuntimeError("closed")
+        await manager.connect(dead_ws, "issue-1")
+
+        await manager.broadcast_to_issue("issue-1", {"type": "log"})
+
+        assert dead_ws not in manager.active_connections["issue-1"]
+
+    async def test_status_update_keeps_native_json_types(self):
+        manager = ConnectionManager()
+        ws = AsyncMock()
+        await manager.connect(ws, "issue-1")
+
+        await manager.send_status_update(
+            "issue-1", "IN_PROGRESS", "working", progress=40, data={"pr": 7}
+        )
+
+        payload = orjson.loads(ws.send_text.await_args.args[0])
+        assert payload["progress"] == 40
+        assert payload["data"] == {"pr": 7}
+        assert payload["timestamp"] is not None